@@ -0,0 +1,151 @@
+"""
+Pack the diagram images into texture atlases with an index of sub-rectangles.
+
+Images are packed into one atlas per resource directory, i.e. per pattern,
+so the images an animation needs arrive in one file open and one decode,
+and no animation decodes another's pixels. The atlases and index.json are
+committed under resources/atlas; AssetManager hands out subsurfaces of them
+and falls back to the loose PNG for images the index does not cover or
+whose PNG is no longer the size recorded for it. The recorded SHA-1 is
+what --check compares, which catches every edit but reads each PNG.
+
+Run from the ``main`` directory after adding or changing a diagram image:
+
+    python -m assets.atlas            # rebuild the atlases
+    python -m assets.atlas --check    # exit 1 if they are out of date
+"""
+import argparse
+import json
+import os
+import sys
+
+import pygame
+
+from assets.files import ATLAS_DIR, RESOURCES, file_hash, source_names, source_path
+
+INDEX_PATH = os.path.join(ATLAS_DIR, "index.json")
+INDEX_VERSION = 2
+
+
+def load_index(path=INDEX_PATH):
+    """Return the atlas index's image entries, or {} if there is no usable index."""
+    try:
+        with open(path) as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if index.get("version") != INDEX_VERSION:
+        return {}
+    return index["images"]
+
+
+def source_images(root=RESOURCES):
+    """Return the diagram images as {sheet name: [image names]}, grouped by directory."""
+    groups = {}
+    for name in source_names(root):
+        groups.setdefault(f"{name.rsplit('/', 1)[0]}.png", []).append(name)
+    return groups
+
+
+def pack(sizes):
+    """
+    Shelf-pack rectangles of the given (w, h) sizes, tallest first.
+
+    Returns the atlas (width, height) and each rectangle's (x, y) in input
+    order. Every shelf width that fits a whole number of the first images is
+    tried and the smallest atlas kept, the squarer one on ties: empty atlas
+    space still costs decode time and memory.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: -sizes[i][1])
+    widths = set()
+    row = 0
+    for i in order:
+        row += sizes[i][0]
+        widths.add(row)
+
+    def area(packed):
+        (w, h), _ = packed
+        return w * h, max(w, h)
+
+    return min((shelf_pack(sizes, order, width) for width in widths), key=area)
+
+
+def shelf_pack(sizes, order, width):
+    """Place rectangles left to right on shelves no wider than width; returns (size, positions)."""
+    positions = [None] * len(sizes)
+    x = y = shelf = 0
+    for i in order:
+        w, h = sizes[i]
+        if x + w > width:
+            x, y, shelf = 0, y + shelf, 0
+        positions[i] = (x, y)
+        x += w
+        shelf = max(shelf, h)
+    # The widest shelf may be narrower than the width allowed
+    used = max(px + sizes[i][0] for i, (px, _) in enumerate(positions))
+    return (used, y + shelf), positions
+
+
+def build(root=RESOURCES, out_dir=ATLAS_DIR):
+    """Write every atlas and the index; returns the index."""
+    images = {}
+    for sheet, names in source_images(root).items():
+        sources = [pygame.image.load(source_path(name, root)) for name in names]
+        size, positions = pack([source.get_size() for source in sources])
+
+        atlas = pygame.Surface(size, pygame.SRCALPHA, 32)
+        for name, source, (x, y) in zip(names, sources, positions):
+            # Copied without blending, so the atlas holds exactly the source pixels
+            atlas.blit(source, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+            images[name] = {
+                "sheet": sheet,
+                "rect": [x, y, *source.get_size()],
+                "sha1": file_hash(source_path(name, root)),
+                "bytes": os.path.getsize(source_path(name, root)),
+            }
+
+        path = os.path.join(out_dir, *sheet.split("/"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        pygame.image.save(atlas, path)
+
+    index = {"version": INDEX_VERSION, "images": images}
+    with open(os.path.join(out_dir, "index.json"), "w") as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+    return index
+
+
+def stale(root=RESOURCES, index_path=INDEX_PATH):
+    """Return the names of images missing from the index or changed since it was built."""
+    images = load_index(index_path)
+    found = []
+    for names in source_images(root).values():
+        for name in names:
+            entry = images.get(name)
+            if entry is None or entry["sha1"] != file_hash(source_path(name, root)):
+                found.append(name)
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="only check that the atlases are up to date")
+    args = parser.parse_args()
+
+    if args.check:
+        found = stale()
+        if found:
+            print("atlases are out of date for:")
+            for name in found:
+                print(f"  {name}")
+            print("run python -m assets.atlas to rebuild them")
+            sys.exit(1)
+        print("atlases are up to date")
+        return
+
+    index = build()
+    sheets = {entry["sheet"] for entry in index["images"].values()}
+    print(f"packed {len(index['images'])} images into {len(sheets)} atlases in {ATLAS_DIR}")
+
+
+if __name__ == "__main__":
+    main()
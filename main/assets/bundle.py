@@ -0,0 +1,150 @@
+"""
+Pre-decoded asset bundle, memory-mapped to skip PNG decoding at startup.
+
+The bundle holds every diagram image already decoded and converted to the
+frames' pixel layout (straight-alpha ARGB32, what to_blit_format produces),
+with its mip levels, after a header indexing each level's offset and size
+and the SHA-1 of the PNG it came from. AssetManager maps the file and
+creates surfaces directly over the mapped pages, so an image costs no
+decode, conversion or copy, and a level's pages are only read in when
+something is scaled from it. Pixels
+stay straight alpha rather than premultiplied because pygame blends straight
+alpha; premultiplied sources would need converting back on every blit.
+
+An image whose PNG no longer matches the recorded hash is ignored and
+decoded from the PNG instead, so a stale bundle is never shown.
+
+The bundle is optional and lives in the user cache directory (see
+bundle_path). Build or refresh it from the ``main`` directory with:
+
+    python -m assets.bundle
+"""
+import argparse
+import json
+import mmap
+import os
+import struct
+
+import pygame
+
+from assets.files import BLIT_ORDER, RESOURCES, cache_dir, file_hash, source_names, source_path, to_blit_format
+from assets.pyramid import build_levels
+
+MAGIC = b"DPAB"
+VERSION = 2
+PREAMBLE = struct.Struct("<4sII")  # magic, version, header length
+
+# Pixel data starts on a page boundary and each image on a cache line
+DATA_ALIGN = mmap.PAGESIZE
+IMAGE_ALIGN = 64
+
+
+def bundle_path():
+    """Return where the bundle is read from: DESIGN_PATTERNS_ASSET_BUNDLE, else the cache directory."""
+    return os.environ.get("DESIGN_PATTERNS_ASSET_BUNDLE") or os.path.join(cache_dir(), "assets.bundle")
+
+
+def align(offset, boundary):
+    return -(-offset // boundary) * boundary
+
+
+class AssetBundle:
+    """A mapped bundle file handing out surfaces that share its pages."""
+
+    def __init__(self, path, root=RESOURCES):
+        self.path = path
+        self.root = root
+        with open(path, "rb") as f:
+            # Copy-on-write, so a stray write to a surface can never reach the file
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        magic, version, length = PREAMBLE.unpack_from(self.map)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} asset bundle")
+        header = json.loads(self.map[PREAMBLE.size:PREAMBLE.size + length])
+        if header["order"] != BLIT_ORDER:
+            raise ValueError(f"{path} was built for {header['order']} pixels, not {BLIT_ORDER}")
+        self.entries = header["images"]
+
+        # Images found stale against their PNG
+        self.stale = set()
+
+    @classmethod
+    def open(cls, path=None):
+        """Return the bundle at path (default bundle_path()), or None if there is no usable one."""
+        path = path or bundle_path()
+        try:
+            return cls(path)
+        except (OSError, ValueError, KeyError, struct.error):
+            return None
+
+    def levels(self, name):
+        """Return surfaces over name's mapped mip levels, largest first, or None if missing or stale."""
+        entry = self.entries.get(name)
+        if entry is None or name in self.stale:
+            return None
+        try:
+            current = file_hash(source_path(name, self.root))
+        except OSError:
+            current = None
+        if current != entry["sha1"]:
+            self.stale.add(name)
+            return None
+
+        pixels = memoryview(self.map)
+        return [pygame.image.frombuffer(pixels[offset:offset + w * h * 4], (w, h), BLIT_ORDER)
+                for offset, w, h in entry["levels"]]
+
+
+def build(path=None, root=RESOURCES):
+    """Decode every diagram image and write the bundle; returns (path, images, bytes)."""
+    path = path or bundle_path()
+    entries = {}
+    blobs = []
+    offset = 0
+    for name in source_names(root):
+        source = source_path(name, root)
+        levels = []
+        for level in build_levels(to_blit_format(pygame.image.load(source))):
+            levels.append([offset, *level.get_size()])
+            blobs.append((offset, pygame.image.tobytes(level, BLIT_ORDER)))
+            offset = align(offset + len(blobs[-1][1]), IMAGE_ALIGN)
+        entries[name] = {"levels": levels, "sha1": file_hash(source)}
+
+    # Offsets in the header are absolute, so its length must be known first
+    def header_for(base):
+        images = {name: {"levels": [[offset + base, w, h] for offset, w, h in entry["levels"]],
+                         "sha1": entry["sha1"]}
+                  for name, entry in entries.items()}
+        return json.dumps({"order": BLIT_ORDER, "images": images}, sort_keys=True).encode()
+
+    base = DATA_ALIGN
+    while PREAMBLE.size + len(header_for(base)) > base:
+        base += DATA_ALIGN
+    header = header_for(base)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    # Written aside and renamed, so a running app keeps its mapping of the old file
+    temp = f"{path}.tmp"
+    with open(temp, "wb") as f:
+        f.write(PREAMBLE.pack(MAGIC, VERSION, len(header)))
+        f.write(header)
+        for offset, blob in blobs:
+            f.seek(base + offset)
+            f.write(blob)
+        size = f.tell()
+    os.replace(temp, path)
+    return path, len(entries), size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--path", help=f"bundle file (default: {bundle_path()})")
+    args = parser.parse_args()
+
+    path, images, size = build(args.path)
+    print(f"bundled {images} images, {size / 2**20:.1f} MB, into {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import hashlib
+import os
+import sys
+
+import pygame
+
+# Diagram images, addressed by their path relative to this directory
+RESOURCES = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "resources", "diagrams"))
+
+# Atlases packing those images, built by assets.atlas
+ATLAS_DIR = os.path.normpath(os.path.join(RESOURCES, "..", "atlas"))
+
+# Byte order giving the 32-bit layout of the frames images are blitted onto (Qt's ARGB32)
+BLIT_ORDER = "BGRA" if sys.byteorder == "little" else "ARGB"
+
+
+def cache_dir():
+    """Return the per-user cache directory ($XDG_CACHE_HOME/design-patterns)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "design-patterns")
+
+
+def source_path(name, root=RESOURCES):
+    """Return the PNG of the image called name ("structural_patterns/adapter/adapter.png")."""
+    return os.path.join(root, *name.split("/"))
+
+
+def to_blit_format(image):
+    """
+    Return image with per-pixel alpha in the frames' pixel layout.
+
+    PNGs decode as RGBA, so every blit onto an ARGB frame would swizzle each
+    pixel; converting once up front makes those blits straight copies and
+    blends. convert_alpha() would do the same, but it needs a display mode,
+    which the renderer never sets.
+    """
+    return pygame.image.frombytes(pygame.image.tobytes(image, BLIT_ORDER), image.get_size(), BLIT_ORDER)
+
+
+def source_names(root=RESOURCES):
+    """Return the names of every diagram image under root."""
+    names = []
+    for directory, _, files in sorted(os.walk(root)):
+        prefix = os.path.relpath(directory, root).replace(os.sep, "/")
+        names += [f"{prefix}/{name}" for name in sorted(files) if name.lower().endswith(".png")]
+    return names
+
+
+def file_hash(path):
+    """Return the SHA-1 of a file's contents, which identifies a source image."""
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
@@ -0,0 +1,188 @@
+import os
+from collections import OrderedDict
+
+import pygame
+
+from assets.atlas import load_index
+from assets.bundle import AssetBundle
+from assets.files import ATLAS_DIR, RESOURCES, source_path, to_blit_format
+from assets.pyramid import build_levels, levels_bytes, pick_level
+from diagnostics.trace import tracer
+
+
+class AssetManager:
+    """
+    Decoded diagram images shared by all animations.
+
+    Images come from the pre-decoded bundle when one has been built (see
+    assets.bundle), as surfaces over its mapped pages. Otherwise they are
+    read from the atlas the index places them in, as subsurfaces, or from
+    their own PNG if no atlas covers them or the PNG has changed size since
+    the atlas was built (checked once per atlas, see verify). Each file is read and
+    decoded once per process and its images are handed out to every
+    animation that asks, so running a pattern again does not touch disk.
+    Sprites are scaled from the image's nearest larger mip level (see
+    scale_source), built on first use or mapped from the bundle.
+    Decoded files and their images' levels are kept in LRU order within a
+    memory budget (DESIGN_PATTERNS_ASSET_CACHE MB, default 96); an evicted
+    image stays valid for the animations holding it and is decoded again
+    when next asked for.
+    """
+
+    instance = None
+
+    @classmethod
+    def get(cls):
+        """Return the process-wide asset manager."""
+        if cls.instance is None:
+            # DESIGN_PATTERNS_ATLAS=0 reads the loose PNGs instead of the atlases
+            index = {} if os.environ.get("DESIGN_PATTERNS_ATLAS") == "0" else None
+            # DESIGN_PATTERNS_ASSET_BUNDLE=0 ignores a built bundle
+            bundle = None if os.environ.get("DESIGN_PATTERNS_ASSET_BUNDLE") == "0" else AssetBundle.open()
+            cls.instance = cls(budget=int(os.environ.get("DESIGN_PATTERNS_ASSET_CACHE", "96")) * 2**20,
+                               index=index, bundle=bundle)
+        return cls.instance
+
+    def __init__(self, root=RESOURCES, budget=96 * 2**20, index=None, bundle=None):
+        self.root = root
+        self.budget = budget
+        self.index = load_index() if index is None else index
+        self.bundle = bundle
+
+        # Decoded files (atlases or loose PNGs) in LRU order, and the images cut from each
+        self.sheets = OrderedDict()
+        self.sheet_images = {}
+        self.images = {}
+        self.images_sheet = {}
+        self.bytes = 0
+
+        # Images handed out from the bundle; its pages belong to the OS page cache, not the budget
+        self.mapped = {}
+
+        # Atlases whose images were checked against their PNGs, and the images found stale
+        self.verified = set()
+        self.stale = set()
+
+        # Mip levels per handed-out image, and the name of every handed-out image
+        self.pyramids = {}
+        self.names = {}
+
+        # Counters for stats()
+        self.hits = 0
+        self.loads = 0
+        self.evictions = 0
+
+    def locate(self, name):
+        """Return (file holding the image called name, its rect there or None for the whole file)."""
+        entry = self.index.get(name)
+        if entry is not None and entry["sheet"] not in self.verified:
+            self.verify(entry["sheet"])
+            entry = self.index.get(name)
+        if entry is not None:
+            return os.path.join(ATLAS_DIR, *entry["sheet"].split("/")), pygame.Rect(entry["rect"])
+        return source_path(name, self.root), None
+
+    def verify(self, sheet):
+        """
+        Drop the index entries of sheet whose PNG changed size since the atlas
+        was built. Only the PNGs are stat'ed, not read, so an atlas still costs
+        one file read; a same-size edit is left to python -m assets.atlas --check.
+        """
+        self.verified.add(sheet)
+        with tracer.span(f"verify {sheet}", "assets"):
+            for name, entry in list(self.index.items()):
+                if entry["sheet"] != sheet:
+                    continue
+                try:
+                    size = os.stat(source_path(name, self.root)).st_size
+                except OSError:
+                    continue  # No PNG to fall back to; the atlas is all there is
+                if size != entry["bytes"]:
+                    del self.index[name]
+                    self.stale.add(name)
+
+    def image(self, name):
+        """Return the shared, blit-ready image called name ("structural_patterns/adapter/adapter.png")."""
+        image = self.images.get(name)
+        if image is not None:
+            self.hits += 1
+            self.sheets.move_to_end(self.images_sheet[name])
+            return image
+
+        image = self.mapped.get(name)
+        if image is None and self.bundle is not None:
+            levels = self.bundle.levels(name)
+            if levels is not None:
+                image = self.mapped[name] = levels[0]
+                self.pyramids[image] = levels
+                self.names[image] = name
+        if image is not None:
+            self.hits += 1
+            return image
+
+        path, rect = self.locate(name)
+        sheet = self.sheets.get(path)
+        if sheet is None:
+            with tracer.span(f"load {os.path.relpath(path, os.path.dirname(self.root))}", "assets"):
+                sheet = to_blit_format(pygame.image.load(path))
+            self.loads += 1
+            self.sheets[path] = sheet
+            self.sheet_images[path] = []
+            self.bytes += sheet.get_bytesize() * sheet.get_width() * sheet.get_height()
+        else:
+            self.hits += 1
+            self.sheets.move_to_end(path)
+
+        image = sheet.subsurface(rect) if rect is not None else sheet
+        self.images[name] = image
+        self.images_sheet[name] = path
+        self.sheet_images[path].append(name)
+        self.names[image] = name
+        self.evict()
+        return image
+
+    def scale_source(self, image, size):
+        """
+        Return the mip level of image to scale it to size from: the smallest at
+        least that large. Images not handed out by the manager are returned as is.
+        """
+        levels = self.pyramids.get(image)
+        if levels is None:
+            name = self.names.get(image)
+            if name is None:
+                return image
+            with tracer.span(f"mip levels {name}", "assets"):
+                levels = self.pyramids[image] = build_levels(image)
+            self.bytes += levels_bytes(levels)
+            self.sheets.move_to_end(self.images_sheet[name])
+            self.evict()
+        return pick_level(levels, size)
+
+    def evict(self):
+        """Drop least recently used files until the cache fits the budget, keeping the newest."""
+        while self.bytes > self.budget and len(self.sheets) > 1:
+            path, sheet = self.sheets.popitem(last=False)
+            for name in self.sheet_images.pop(path):
+                image = self.images.pop(name)
+                del self.images_sheet[name]
+                del self.names[image]
+                levels = self.pyramids.pop(image, None)
+                if levels is not None:
+                    self.bytes -= levels_bytes(levels)
+            self.bytes -= sheet.get_bytesize() * sheet.get_width() * sheet.get_height()
+            self.evictions += 1
+
+    def stats(self):
+        """Return hit/load/eviction counters and the memory the decoded files and their mip levels take."""
+        lookups = self.hits + self.loads
+        return {
+            "hits": self.hits,
+            "loads": self.loads,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "files": len(self.sheets),
+            "images": len(self.images),
+            "bytes": self.bytes,
+            "mapped": len(self.mapped),
+            "stale": len(self.stale),
+        }
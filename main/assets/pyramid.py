@@ -0,0 +1,34 @@
+import pygame
+
+# Levels stop once the next one would be smaller than this on either side
+MIN_LEVEL = 32
+
+
+def build_levels(image):
+    """
+    Return the mip levels of image: the image itself, then successive halvings.
+
+    Each level is averaged down from the previous one, so it is a clean
+    2x2 box filter of it; scaling to an on-screen size from the nearest
+    larger level then reads a fraction of the source pixels.
+    """
+    levels = [image]
+    w, h = image.get_size()
+    while w // 2 >= MIN_LEVEL and h // 2 >= MIN_LEVEL:
+        w, h = w // 2, h // 2
+        levels.append(pygame.transform.smoothscale(levels[-1], (w, h)))
+    return levels
+
+
+def pick_level(levels, size):
+    """Return the smallest level at least size in both dimensions (the largest if none is)."""
+    w, h = size
+    for level in reversed(levels):
+        if level.get_width() >= w and level.get_height() >= h:
+            return level
+    return levels[0]
+
+
+def levels_bytes(levels):
+    """Return the memory the levels below the image itself take."""
+    return sum(level.get_bytesize() * level.get_width() * level.get_height() for level in levels[1:])
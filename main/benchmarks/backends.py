@@ -0,0 +1,68 @@
+"""
+Compare the CPU cost per frame of the raster and scene rendering backends.
+
+Each frame runs the animation's update_frame and then lets Qt paint the
+viewport, so the numbers include both building and presenting the frame.
+
+Run from the ``main`` directory:
+
+    python -m benchmarks.backends --size 1920x1080 --frames 300
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from PySide6.QtWidgets import QApplication
+
+from export import parse_size
+from views.diagram_view import DiagramView
+from views.pattern_diagrams.PatternAnimation import PatternAnimation
+
+
+def measure(app, view, name, backend, frames):
+    """Return CPU milliseconds per frame for one pattern on one backend."""
+    view.backend = backend
+    view.draw_pattern_from_data({"name": name})
+    app.processEvents()
+
+    anim = view.current_anim
+    anim.stop()
+    for _ in range(10):  # warm up caches and the static layer
+        anim.update_frame()
+        app.processEvents()
+
+    start = time.process_time()
+    for _ in range(frames):
+        anim.update_frame()
+        app.processEvents()
+    return (time.process_time() - start) / frames * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=parse_size, default="1920x1080", help="viewport size as WIDTHxHEIGHT")
+    parser.add_argument("--frames", type=int, default=300, help="frames per pattern and backend")
+    args = parser.parse_args()
+
+    w, h = args.size
+    app = QApplication([])
+    view = DiagramView()
+    view.resize(w, h)
+    view.show()
+    app.processEvents()
+
+    backends = list(PatternAnimation.BACKENDS)
+    print(f"{w}x{h}, {args.frames} frames, CPU ms/frame")
+    print(f"{'pattern':<18}" + "".join(f"{name:>10}" for name in backends))
+    for name in view.animations:
+        row = [measure(app, view, name, backend, args.frames) for backend in backends]
+        print(f"{name:<18}" + "".join(f"{ms:>10.3f}" for ms in row))
+
+    del app
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Compare cold start with lazily and eagerly imported animations.
+
+Each run starts a fresh interpreter with ``-X importtime`` that builds and
+shows MainWindow and exits at its first paint. "lazy" is the app as it
+ships, importing animations on first use; "eager" imports all of them
+before MainWindow is built, as diagram_view.py used to. Reported per mode,
+as medians over the runs:
+
+    first paint   wall time from launching the process to MainWindow's first paint
+    imports       total import time from -X importtime
+    modules       modules imported by then
+    pygame        whether pygame was imported by then
+
+Run from the ``main`` directory:
+
+    python -m benchmarks.cold_start --runs 10
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+MAIN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in the child; prints one JSON line at the first paint
+CHILD = """
+import json, sys, time
+from PySide6.QtCore import QEvent, QObject
+from PySide6.QtWidgets import QApplication
+
+app = QApplication([])
+if {eager}:
+    from views.animation_registry import AnimationRegistry
+    AnimationRegistry().load_all()
+from views.main_window import MainWindow
+
+class FirstPaint(QObject):
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Paint:
+            print(json.dumps({{"first_paint": time.time(), "pygame": "pygame" in sys.modules,
+                               "modules": len(sys.modules)}}), flush=True)
+            app.exit()
+        return False
+
+window = MainWindow()
+first_paint = FirstPaint()
+window.installEventFilter(first_paint)
+window.show()
+app.exec()
+"""
+
+
+def import_time_ms(stderr):
+    """Sum the self times reported by -X importtime, in ms."""
+    total = 0
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            field = line.split(":", 1)[1].split("|")[0].strip()
+            if field.isdigit():
+                total += int(field)
+    return total / 1000
+
+
+def run(eager):
+    """Start one app process; return its first paint ms, import ms, module count and pygame flag."""
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+
+    launched = time.time()
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", CHILD.format(eager=eager)],
+                            cwd=MAIN_DIR, env=env, capture_output=True, text=True, check=True)
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    return {
+        "first_paint": (report["first_paint"] - launched) * 1000,
+        "imports": import_time_ms(result.stderr),
+        "modules": report["modules"],
+        "pygame": report["pygame"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="processes started per mode")
+    args = parser.parse_args()
+
+    # One unmeasured start so both modes see warm OS file caches
+    run(True)
+
+    print(f"{'mode':<8}{'first paint ms':>16}{'imports ms':>12}{'modules':>9}{'pygame':>8}")
+    for mode, eager in (("eager", True), ("lazy", False)):
+        results = [run(eager) for _ in range(args.runs)]
+        print(f"{mode:<8}"
+              f"{statistics.median(r['first_paint'] for r in results):>16.1f}"
+              f"{statistics.median(r['imports'] for r in results):>12.1f}"
+              f"{statistics.median(r['modules'] for r in results):>9.0f}"
+              f"{'yes' if results[0]['pygame'] else 'no':>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Compare the pygame -> Qt frame handoff paths used by PatternAnimation.
+
+Run from the ``main`` directory:
+
+    python -m benchmarks.frame_handoff --size 1920x1080 --frames 300
+"""
+import argparse
+import os
+import time
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from PySide6.QtGui import QGuiApplication, QImage, QPixmap
+
+from export import parse_size
+from views.pattern_diagrams.raster_backend import RasterBackend
+
+
+def legacy_handoff(surface):
+    """The original path: tostring copy, RGBA8888 QImage, converting QPixmap."""
+    w, h = surface.get_size()
+    data = pygame.image.tostring(surface, "RGBA")
+    return QPixmap.fromImage(QImage(data, w, h, QImage.Format_RGBA8888))
+
+
+def wrapped_handoff(image):
+    """The current path: a long-lived RGB32 QImage over the surface's own buffer."""
+    return QPixmap.fromImage(image)
+
+
+def make_frame(w, h):
+    """Build a frame that looks like an animation tick: opaque background plus sprites."""
+    surface = pygame.Surface((w, h), pygame.SRCALPHA)
+    surface.fill((30, 30, 30, 255))
+    sprite = pygame.Surface((w // 8, h // 6), pygame.SRCALPHA)
+    sprite.fill((200, 120, 40, 180))
+    for i in range(6):
+        surface.blit(sprite, (i * w // 7, i * h // 8))
+    return surface
+
+
+def copied_bytes(surface, handoff):
+    """
+    Return the bytes one handoff copies: Python buffers seen by tracemalloc,
+    plus the pixmap's pixels unless it shares the surface's buffer.
+    """
+    tracemalloc.start()
+    pixmap = handoff()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # A pixmap sharing the surface's buffer sees a later write to the surface
+    before = surface.get_at((0, 0))
+    surface.set_at((0, 0), (255 - before.r, before.g, before.b, 255))
+    shared = pixmap.toImage().pixelColor(0, 0).red() == 255 - before.r
+    surface.set_at((0, 0), before)
+    return peak + (0 if shared else pixmap.toImage().sizeInBytes())
+
+
+def measure(fn, frames):
+    start = time.perf_counter()
+    for _ in range(frames):
+        fn()
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=parse_size, default="1920x1080", help="frame size as WIDTHxHEIGHT")
+    parser.add_argument("--frames", type=int, default=300, help="frames per path")
+    args = parser.parse_args()
+
+    w, h = args.size
+    app = QGuiApplication([])
+    surface = make_frame(w, h)
+    image = RasterBackend.wrap_surface(surface)
+    frame_bytes = surface.get_pitch() * h
+
+    paths = [
+        ("legacy tostring", lambda: legacy_handoff(surface)),
+        ("wrapped buffer", lambda: wrapped_handoff(image)),
+    ]
+
+    print(f"{w}x{h}, {args.frames} frames, {frame_bytes / 1e6:.1f} MB per frame")
+    print(f"{'path':<18}{'ms/frame':>10}{'MB copied/frame':>18}{'MB/s at 60 fps':>16}")
+    for name, fn in paths:
+        fn()  # warm up
+        copied = copied_bytes(surface, fn)
+        ms = measure(fn, args.frames)
+        print(f"{name:<18}{ms:>10.3f}{copied / 1e6:>18.1f}{copied * 60 / 1e6:>16.0f}")
+
+    del app
+
+
+if __name__ == "__main__":
+    main()
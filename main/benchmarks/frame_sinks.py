@@ -0,0 +1,74 @@
+"""
+Compare the paint cost of the raster backend's frame sinks.
+
+Every pattern runs on each sink; a frame is update_frame plus the repaint
+Qt schedules for it. "paint" is the time the sink itself spends painting.
+
+Run from the ``main`` directory:
+
+    python -m benchmarks.frame_sinks --size 1920x1080 --frames 200
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from PySide6.QtWidgets import QApplication
+
+from export import parse_size
+from views.diagram_view import DiagramView
+from views.pattern_diagrams.frame_sinks import FRAME_SINKS
+
+
+def measure(app, view, name, sink, frames):
+    """Return (CPU ms/frame, sink paint ms/frame) for one pattern on one sink."""
+    view.backend = "raster"
+    view.frame_sink = sink
+    view.draw_pattern_from_data({"name": name})
+    app.processEvents()
+
+    anim = view.current_anim
+    anim.stop()
+    for _ in range(10):  # warm up caches and the static layer
+        anim.update_frame()
+        app.processEvents()
+
+    stats = anim.backend.sink
+    stats.paints, stats.paint_seconds = 0, 0.0
+
+    start = time.process_time()
+    for _ in range(frames):
+        anim.update_frame()
+        app.processEvents()
+    cpu = (time.process_time() - start) / frames * 1000
+    return cpu, stats.paint_seconds / frames * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=parse_size, default="1920x1080", help="viewport size as WIDTHxHEIGHT")
+    parser.add_argument("--frames", type=int, default=200, help="frames per pattern and sink")
+    args = parser.parse_args()
+
+    w, h = args.size
+    app = QApplication([])
+    view = DiagramView()
+    view.resize(w, h)
+    view.show()
+    app.processEvents()
+
+    print(f"{w}x{h}, {args.frames} frames x {len(view.animations)} patterns, means per frame")
+    print(f"{'sink':<12}{'CPU ms':>10}{'paint ms':>10}")
+    for sink in FRAME_SINKS:
+        results = [measure(app, view, name, sink, args.frames) for name in view.animations]
+        cpu = sum(r[0] for r in results) / len(results)
+        paint = sum(r[1] for r in results) / len(results)
+        print(f"{sink:<12}{cpu:>10.3f}{paint:>10.3f}")
+
+    del app
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""
+Measure per-animation frame times by stage and check them against a baseline.
+
+Every pattern in DiagramView.animations is driven through one full loop of
+its timeline at each viewport size. A frame is update_frame plus the repaint
+Qt does for it, split into stages:
+
+    evaluate  timeline lookup of the frame's track values
+    draw      the animation's draw_frame, recording draw calls (minus text/scale)
+    text      label rendering (label cache)
+    scale     sprite scaling (scaled sprite cache)
+    clear     restoring the static layer where the last frame drew
+    blit      rasterising the recorded draw calls with pygame
+    convert   pygame surface -> QImage handoff
+    present   handing the frame to the sink and Qt painting it
+
+Run from the ``main`` directory:
+
+    python -m benchmarks.frame_times                    # report, compare with the baseline
+    python -m benchmarks.frame_times --save-baseline    # record this machine's baseline
+
+The run exits with status 1 when a frame time percentile regresses by more
+than the tolerance. Baselines are only comparable on the machine that wrote them.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from collections import defaultdict
+
+from export import application, create_view, parse_size
+from views.diagram_view import DiagramView
+
+STAGES = ("evaluate", "draw", "text", "scale", "clear", "blit", "convert", "present")
+PERCENTILES = (50, 95, 99)
+
+SIZES = {
+    "720p": (1280, 720),
+    "1080p": (1920, 1080),
+    "4k": (3840, 2160),
+}
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baselines", "frame_times.json")
+
+
+class StageTimer:
+    """Accumulates the time spent in wrapped methods, per stage, for the current frame."""
+
+    def __init__(self):
+        self.frame = defaultdict(float)
+
+    def wrap(self, obj, name, stage):
+        """Replace obj.name with a version that adds its running time to stage."""
+        method = getattr(obj, name)
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.frame[stage] += time.perf_counter() - start
+
+        setattr(obj, name, timed)
+
+    def take(self):
+        """Return this frame's stage times in ms and start the next frame."""
+        frame = {stage: self.frame[stage] * 1000 for stage in STAGES}
+        # text and scale run inside draw_frame
+        frame["draw"] -= frame["text"] + frame["scale"]
+        self.frame = defaultdict(float)
+        return frame
+
+
+def percentiles(values):
+    """Return nearest-rank percentiles of values."""
+    ordered = sorted(values)
+    return {f"p{p}": ordered[min(len(ordered) - 1, len(ordered) * p // 100)] for p in PERCENTILES}
+
+
+def instrument(anim, stages):
+    """Wrap the methods that make up each stage of the animation's frames."""
+    backend = anim.backend
+    stages.wrap(anim.get_timeline(), "evaluate", "evaluate")
+    stages.wrap(anim, "draw_frame", "draw")
+    stages.wrap(backend, "render_text", "text")
+    stages.wrap(anim, "scale_to", "scale")
+    for surface, _ in backend.buffers:
+        stages.wrap(surface, "restore", "clear")
+        stages.wrap(surface, "render", "blit")
+    stages.wrap(backend, "to_qimage", "convert")
+    stages.wrap(backend.sink, "present", "present")
+
+
+def measure(app, name, size, warmup):
+    """Run one loop of a pattern at a size; return frame time percentiles, overall and per stage."""
+    view = create_view(size)
+    view.frame_sink = "item"
+    view.draw_pattern_from_data({"name": name})
+    app.processEvents()
+
+    anim = view.current_anim
+    anim.stop()
+    for _ in range(warmup):
+        anim.update_frame()
+        app.processEvents()
+    anim.seek(0)
+    app.processEvents()
+
+    stages = StageTimer()
+    instrument(anim, stages)
+
+    totals, frames = [], []
+    for _ in range(anim.get_timeline().duration):
+        start = time.perf_counter()
+        anim.update_frame()
+        paint_start = time.perf_counter()
+        app.processEvents()
+        end = time.perf_counter()
+
+        stages.frame["present"] += end - paint_start
+        totals.append((end - start) * 1000)
+        frames.append(stages.take())
+
+    anim.dispose()
+    view.deleteLater()
+    app.processEvents()
+
+    return {
+        "frames": len(totals),
+        "total": percentiles(totals),
+        "stages": {stage: percentiles([frame[stage] for frame in frames]) for stage in STAGES},
+    }
+
+
+# ---------------- Baseline ----------------
+
+def regressions(results, baseline, tolerance, min_delta):
+    """Return descriptions of total frame time percentiles worse than the baseline by more than tolerance."""
+    found = []
+    for key, result in results.items():
+        old = baseline.get("results", {}).get(key)
+        if old is None:
+            continue
+        for p, ms in result["total"].items():
+            before = old["total"][p]
+            # Tiny absolute changes are timer noise, however large the ratio
+            if ms > before * (1 + tolerance) and ms - before > min_delta:
+                found.append(f"{key} {p}: {before:.3f} -> {ms:.3f} ms")
+    return found
+
+
+def named_size(text):
+    """Return (label, (width, height)) for a size name in SIZES or WIDTHxHEIGHT."""
+    if text.lower() in SIZES:
+        return text.lower(), SIZES[text.lower()]
+    return text.lower(), parse_size(text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--patterns", nargs="+", help="pattern names (default: all)")
+    parser.add_argument("--sizes", nargs="+", type=named_size, default=[named_size(size) for size in SIZES],
+                        help="720p, 1080p, 4k or WIDTHxHEIGHT")
+    parser.add_argument("--warmup", type=int, default=10, help="frames run before measuring")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown as a fraction (0.25 = 25%%)")
+    parser.add_argument("--min-delta", type=float, default=0.05, help="ignore slowdowns below this many ms")
+    args = parser.parse_args()
+
+    app = application()
+    patterns = [name.lower() for name in args.patterns] if args.patterns else list(DiagramView().animations)
+
+    results = {}
+    for label, size in args.sizes:
+        print(f"\n{label} ({size[0]}x{size[1]}): frame ms p50/p95/p99, stage ms p95")
+        print(f"{'pattern':<18}{'frames':>7}{'p50':>8}{'p95':>8}{'p99':>8}  "
+              + "".join(f"{stage:>9}" for stage in STAGES))
+        for name in patterns:
+            result = measure(app, name, size, args.warmup)
+            results[f"{name}@{size[0]}x{size[1]}"] = result
+            total = result["total"]
+            print(f"{name:<18}{result['frames']:>7}{total['p50']:>8.3f}{total['p95']:>8.3f}{total['p99']:>8.3f}  "
+                  + "".join(f"{result['stages'][stage]['p95']:>9.3f}" for stage in STAGES))
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump({"machine": platform.platform(), "python": platform.python_version(),
+                       "results": results}, f, indent=2, sort_keys=True)
+        print(f"\nbaseline written to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"\nno baseline at {args.baseline}; run with --save-baseline to create one")
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    found = regressions(results, baseline, args.tolerance, args.min_delta)
+    if found:
+        print(f"\nregressions beyond {args.tolerance:.0%}:")
+        for line in found:
+            print(f"  {line}")
+        sys.exit(1)
+    print(f"\nno regressions beyond {args.tolerance:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
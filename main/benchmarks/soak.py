@@ -0,0 +1,153 @@
+"""
+Soak test pattern switching for leaks and per-frame allocations.
+
+The switching phase cycles DiagramView through every pattern many times,
+running a few frames of each, the way a user clicking through the list
+would. Replaced animations must all be garbage collected and the process
+RSS must stay flat once the shared caches are warm.
+
+The allocation phase runs each pattern's loop twice under tracemalloc and
+checks the Python memory allocated within one update_frame (peak) and the
+memory the second loop kept on top of the first (retained) against budgets.
+
+Run from the ``main`` directory:
+
+    python -m benchmarks.soak --switches 2000
+
+Exits with status 1 if any check fails.
+"""
+import argparse
+import gc
+import resource
+import sys
+import time
+import tracemalloc
+import weakref
+
+from export import application, create_view, parse_size
+
+
+def rss_mb():
+    """Return the current resident set size in MB (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * resource.getpagesize() / 2**20
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def soak(app, view, switches, frames, warmup_cycles):
+    """Switch patterns repeatedly; return (RSS per cycle in MB, animations still alive at the end)."""
+    names = list(view.animations)
+    alive = weakref.WeakSet()
+    samples = []
+
+    for i in range(switches):
+        view.draw_pattern_from_data({"name": names[i % len(names)]})
+        app.processEvents()  # starts the animation
+
+        anim = view.current_anim
+        alive.add(anim)
+        for _ in range(frames):
+            anim.update_frame()
+            app.processEvents()
+
+        if (i + 1) % len(names) == 0:
+            gc.collect()
+            samples.append(rss_mb())
+            cycle = len(samples)
+            if cycle == warmup_cycles or cycle % 20 == 0:
+                print(f"  {i + 1:>6} switches  RSS {samples[-1]:8.1f} MB")
+
+    # Switching to no animation disposes of the last one too
+    anim = None
+    view.draw_pattern_from_data({"name": ""})
+    app.processEvents()
+    gc.collect()
+    return samples, len(alive)
+
+
+def allocations(app, view, name):
+    """Return (peak KB allocated within a frame, bytes retained per frame) over warm loops."""
+    view.draw_pattern_from_data({"name": name})
+    app.processEvents()
+    anim = view.current_anim
+    anim.stop()
+
+    loop = anim.get_timeline().duration
+    for _ in range(loop):  # fill the sprite, label and timeline caches first
+        anim.update_frame()
+
+    # Two traced loops: whatever the second one adds on top of the first is growth,
+    # not the working set of the frames on screen and the bounded caches
+    tracemalloc.start()
+    peak = 0
+    after_loop = []
+    for _ in range(2):
+        for _ in range(loop):
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            anim.update_frame()
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - before)
+        after_loop.append(tracemalloc.get_traced_memory()[0])
+    tracemalloc.stop()
+
+    return peak / 1024, (after_loop[1] - after_loop[0]) / loop
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--switches", type=int, default=2000, help="pattern switches to run")
+    parser.add_argument("--frames", type=int, default=3, help="frames run after each switch")
+    parser.add_argument("--size", type=parse_size, default="1280x720", help="viewport size as WIDTHxHEIGHT")
+    parser.add_argument("--backend", default="raster", choices=["raster", "scene"], help="rendering backend")
+    parser.add_argument("--sink", default="item", help="frame sink of the raster backend")
+    parser.add_argument("--warmup-cycles", type=int, default=3,
+                        help="cycles through all patterns before RSS must stay flat")
+    parser.add_argument("--rss-tolerance", type=float, default=16.0, help="allowed RSS growth after warm-up, MB")
+    parser.add_argument("--frame-budget", type=float, default=64.0, help="allowed peak KB allocated in one frame")
+    parser.add_argument("--retained-budget", type=float, default=16.0, help="allowed bytes retained per frame")
+    args = parser.parse_args()
+
+    app = application()
+    view = create_view(args.size)
+    view.backend = args.backend
+    view.frame_sink = args.sink
+    failures = []
+
+    print(f"switching {args.switches} times, {args.frames} frames each ({args.backend} backend)")
+    start = time.perf_counter()
+    samples, alive = soak(app, view, args.switches, args.frames, args.warmup_cycles)
+    print(f"  done in {time.perf_counter() - start:.1f} s")
+
+    if alive:
+        failures.append(f"{alive} replaced animations were never collected")
+    if len(samples) > args.warmup_cycles:
+        growth = samples[-1] - samples[args.warmup_cycles - 1]
+        print(f"  RSS after warm-up {samples[args.warmup_cycles - 1]:.1f} MB, at the end {samples[-1]:.1f} MB")
+        if growth > args.rss_tolerance:
+            failures.append(f"RSS grew {growth:.1f} MB after warm-up (tolerance {args.rss_tolerance} MB)")
+    else:
+        print("  too few switches to check RSS after warm-up")
+
+    print(f"\n{'pattern':<18}{'peak KB/frame':>15}{'retained B/frame':>18}")
+    for name in view.animations:
+        peak, retained = allocations(app, view, name)
+        print(f"{name:<18}{peak:>15.1f}{retained:>18.1f}")
+        if peak > args.frame_budget:
+            failures.append(f"{name} allocates {peak:.1f} KB within a frame (budget {args.frame_budget} KB)")
+        if retained > args.retained_budget:
+            failures.append(f"{name} retains {retained:.1f} B per frame (budget {args.retained_budget} B)")
+
+    if failures:
+        print("\nfailed:")
+        for line in failures:
+            print(f"  {line}")
+        sys.exit(1)
+    print("\nok")
+
+
+if __name__ == "__main__":
+    main()
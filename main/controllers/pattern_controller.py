@@ -1,3 +1,6 @@
+from diagnostics.trace import traced, tracer
+
+
 class PatternController:
     def __init__(self, data, view):
         self.data = data
@@ -6,7 +9,9 @@ class PatternController:
         # Connect signals
         self.view.type_combo.currentTextChanged.connect(self.type_selected)
         self.view.run_button.clicked.connect(self.run_pattern)
+        self.view.speed_combo.currentTextChanged.connect(self.speed_selected)
 
+    @traced("app")
     def type_selected(self, pattern_type):
         # Skip placeholder
         if pattern_type == "Select pattern type":
@@ -15,6 +20,11 @@ class PatternController:
         patterns = self.data.get_patterns_by_type(pattern_type)
         self.view.update_pattern_dropdown(patterns)
 
+    def speed_selected(self, speed):
+        # Items look like "0.5x"
+        self.view.set_playback_rate(float(speed.rstrip("x")))
+
+    @traced("app")
     def run_pattern(self):
         pattern_name = self.view.pattern_combo.currentText()
 
@@ -23,12 +33,14 @@ class PatternController:
             self.view.show_message("Select a pattern!")
             return
 
-        pattern_data = self.data.get_pattern(pattern_name)
+        with tracer.span("PatternData.get_pattern", "app"):
+            pattern_data = self.data.get_pattern(pattern_name)
 
         if pattern_data:
             self.view.clear_message()
             # Load diagram image
             self.view.draw_pattern(pattern_data)
             # Show code
-            self.view.show_code(pattern_data.get("code", ""))
+            with tracer.span("PatternView.show_code", "app"):
+                self.view.show_code(pattern_data.get("code", ""))
 
@@ -0,0 +1,168 @@
+"""
+Opt-in tracing of app and frame activity in Chrome's Trace Event Format.
+
+Set DESIGN_PATTERNS_TRACE to a file path to record spans while the app runs;
+the trace is written there at exit and loads in Perfetto (ui.perfetto.dev)
+or chrome://tracing. Spans go into a fixed-size ring, so a long session
+keeps only its most recent DESIGN_PATTERNS_TRACE_EVENTS events (default
+200000, at least 1) and memory stays bounded. While tracing is off,
+recording a span is a single attribute check.
+
+Spans are recorded either around a block:
+
+    with tracer.span("PatternData.get_pattern", "app"):
+        ...
+
+by decorating a function with @traced("app"), or, in hot code that already
+takes a perf_counter() start, with tracer.complete(name, cat, start).
+"""
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+
+
+class Span:
+    """Context manager recording one complete event when it exits."""
+
+    __slots__ = ("tracer", "name", "cat", "args", "start")
+
+    def __init__(self, tracer, name, cat, args):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.complete(self.name, self.cat, self.start, self.args)
+        return False
+
+
+class NullSpan:
+    """Span handed out while tracing is off; does nothing."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_SPAN = NullSpan()
+
+
+class Tracer:
+    """Ring buffer of complete ("X") trace events, written out as Trace Event Format JSON."""
+
+    def __init__(self, capacity=200000):
+        self.enabled = False
+        self.path = None
+        # At least one slot, so the ring index never divides by zero
+        self.capacity = max(1, capacity)
+        self.events = []
+        self.next = 0
+        self.dropped = 0
+        self.pid = os.getpid()
+        self.thread_names = {}
+
+    def start(self, path=None, capacity=None):
+        """Start recording, dropping anything recorded before; path is where save() writes by default."""
+        if capacity is not None:
+            self.capacity = max(1, capacity)
+        self.path = path
+        self.events = [None] * self.capacity
+        self.next = 0
+        self.dropped = 0
+        self.enabled = True
+
+    def stop(self):
+        """Stop recording; recorded events are kept until the next start()."""
+        self.enabled = False
+
+    def span(self, name, cat="app", args=None):
+        """Return a context manager recording a span around its block."""
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, name, cat, args)
+
+    def complete(self, name, cat, start, args=None):
+        """Record a span from perf_counter() time start until now."""
+        if not self.enabled:
+            return
+        end = time.perf_counter()
+        tid = threading.get_native_id()
+        if tid not in self.thread_names:
+            self.thread_names[tid] = threading.current_thread().name
+
+        index = self.next % self.capacity
+        if self.events[index] is not None:
+            self.dropped += 1
+        self.events[index] = (name, cat, start, end - start, tid, args)
+        self.next += 1
+
+    def recorded(self):
+        """Return the recorded events, oldest first."""
+        if self.next <= self.capacity:
+            return self.events[:self.next]
+        index = self.next % self.capacity
+        return self.events[index:] + self.events[:index]
+
+    def to_json(self):
+        """Return the recording as a Trace Event Format object."""
+        events = [{"name": "process_name", "ph": "M", "pid": self.pid, "tid": 0,
+                   "args": {"name": "DesignPatterns"}}]
+        for tid, name in self.thread_names.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid, "args": {"name": name}})
+
+        for name, cat, start, duration, tid, args in self.recorded():
+            event = {"name": name, "cat": cat, "ph": "X", "pid": self.pid, "tid": tid,
+                     "ts": start * 1e6, "dur": duration * 1e6}
+            if args:
+                event["args"] = args
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms",
+                "otherData": {"dropped_events": self.dropped}}
+
+    def save(self, path=None):
+        """Write the recording to path (default: the path given to start); returns the path written."""
+        path = path or self.path
+        with open(path, "w") as f:
+            json.dump(self.to_json(), f, separators=(",", ":"))
+        return path
+
+
+def traced(cat="app", name=None):
+    """Decorate a function so each call is recorded as a span named after it."""
+    def decorate(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                tracer.complete(span_name, cat, start)
+        return wrapper
+    return decorate
+
+
+def save_at_exit():
+    if tracer.enabled and tracer.path:
+        tracer.save()
+
+
+tracer = Tracer()
+
+if os.environ.get("DESIGN_PATTERNS_TRACE"):
+    tracer.start(os.environ["DESIGN_PATTERNS_TRACE"],
+                 int(os.environ.get("DESIGN_PATTERNS_TRACE_EVENTS", "200000")))
+    atexit.register(save_at_exit)
@@ -0,0 +1,139 @@
+"""
+Watchdog sampling the GUI thread's Python stack while the event loop stalls.
+
+A background thread posts a ping event to the GUI thread and waits for it to
+be handled, which only happens once control is back in the Qt event loop.
+When a ping is not handled within the budget (default 32 ms, twice the
+16 ms animation tick) the GUI thread is stalled: until the ping comes
+through, its stack is sampled every few milliseconds via
+sys._current_frames(). Samples are aggregated as collapsed stacks, one
+``root;...;leaf count`` line per distinct stack, which flamegraph.pl,
+speedscope and Perfetto all read.
+
+Set DESIGN_PATTERNS_WATCHDOG to the output path to run it with the app;
+DESIGN_PATTERNS_WATCHDOG_BUDGET_MS changes the budget.
+"""
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+from PySide6.QtCore import QCoreApplication, QEvent, QObject
+
+PING = QEvent.Type(QEvent.registerEventType())
+
+
+class Heartbeat(QObject):
+    """Lives in the GUI thread and answers the watchdog's pings."""
+
+    def __init__(self):
+        super().__init__()
+        self.acked = threading.Event()
+        self.acked_at = 0.0
+
+    def event(self, event):
+        if event.type() == PING:
+            self.acked_at = time.perf_counter()
+            self.acked.set()
+            return True
+        return super().event(event)
+
+
+class Watchdog:
+    """Detects event loop stalls longer than budget_ms and collects the GUI thread's stacks during them."""
+
+    def __init__(self, budget_ms=32.0, sample_ms=5.0, path=None):
+        self.budget = budget_ms / 1000
+        self.sample_interval = sample_ms / 1000
+        # Healthy pings go out at half the budget, so a stall is noticed at most 1.5 budgets in
+        self.period = self.budget / 2
+        self.path = path
+
+        self.stacks = Counter()
+        self.samples = 0
+        self.stalls = 0
+        self.longest = 0.0
+        self.stalled_total = 0.0
+
+        self.heartbeat = None
+        self.thread = None
+        self.stopping = threading.Event()
+        self.main_id = threading.main_thread().ident
+
+    @classmethod
+    def from_environment(cls):
+        """Return a started watchdog if DESIGN_PATTERNS_WATCHDOG asks for one, else None."""
+        path = os.environ.get("DESIGN_PATTERNS_WATCHDOG")
+        if not path:
+            return None
+        watchdog = cls(float(os.environ.get("DESIGN_PATTERNS_WATCHDOG_BUDGET_MS", "32")), path=path)
+        watchdog.start()
+        return watchdog
+
+    def start(self):
+        """Start watching; call from the GUI thread once the QApplication exists."""
+        self.heartbeat = Heartbeat()
+        self.stopping.clear()
+        self.thread = threading.Thread(target=self.run, name="watchdog", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Stop watching, before the QApplication goes away."""
+        self.stopping.set()
+        self.heartbeat.acked.set()
+        self.thread.join()
+
+    def run(self):
+        acked = self.heartbeat.acked
+        while not self.stopping.is_set():
+            acked.clear()
+            sent = time.perf_counter()
+            QCoreApplication.postEvent(self.heartbeat, QEvent(PING))
+            if acked.wait(self.budget):
+                self.stopping.wait(self.period)
+                continue
+
+            # Stalled: sample until the event loop gets to the ping
+            while not self.stopping.is_set():
+                self.sample()
+                if acked.wait(self.sample_interval):
+                    break
+            if self.stopping.is_set():
+                break
+            self.record_stall(self.heartbeat.acked_at - sent)
+
+    def sample(self):
+        """Add the GUI thread's current stack to the collapsed stacks."""
+        frame = sys._current_frames().get(self.main_id)
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(f"{getattr(code, 'co_qualname', code.co_name)} "
+                         f"({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            frame = frame.f_back
+        if names:
+            self.stacks[";".join(reversed(names))] += 1
+            self.samples += 1
+
+    def record_stall(self, duration):
+        self.stalls += 1
+        self.stalled_total += duration
+        self.longest = max(self.longest, duration)
+
+    def stats(self):
+        """Return the stall count, longest and total stalled ms and the number of stack samples."""
+        return {
+            "stalls": self.stalls,
+            "longest_ms": self.longest * 1000,
+            "stalled_ms": self.stalled_total * 1000,
+            "samples": self.samples,
+        }
+
+    def save(self, path=None):
+        """Write the collapsed stacks, most sampled first; returns the path written."""
+        path = path or self.path
+        with open(path, "w") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        return path
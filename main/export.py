@@ -0,0 +1,216 @@
+"""
+Export pattern animations headlessly as PNG sequences, GIFs or WebPs.
+
+Every pattern x resolution pair is rendered in its own worker process with
+the offscreen Qt platform and SDL's dummy video driver. Frames are written
+out one at a time (PNG files, or piped to ffmpeg for GIF/WebP), so even a
+4K clip is never held in memory as a whole.
+
+Run from the ``main`` directory:
+
+    python export.py --patterns builder adapter --sizes 1280x720 1920x1080 --format gif
+"""
+import argparse
+import multiprocessing
+import os
+import shutil
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication, QFrame
+
+from views.animation_registry import ANIMATIONS
+from views.diagram_view import DiagramView
+
+FORMATS = ("png", "gif", "webp")
+
+# Design frames per second of the animation timelines
+DESIGN_FPS = 60
+
+
+# ---------------- Frame writers ----------------
+
+class PngSequenceWriter:
+    """Saves each frame as a numbered PNG in a directory."""
+
+    def __init__(self, path, size, fps):
+        self.path = path
+        self.frames = 0
+        os.makedirs(path, exist_ok=True)
+
+    def write(self, image):
+        image.save(os.path.join(self.path, f"frame_{self.frames:05d}.png"))
+        self.frames += 1
+
+    def close(self):
+        pass
+
+
+class FfmpegWriter:
+    """Streams raw BGRA frames into an ffmpeg process that encodes a GIF or WebP."""
+
+    # GIF palettes are built per frame, so ffmpeg does not buffer the clip for a global one
+    CODECS = {
+        "gif": ["-filter_complex", "split[a][b];[a]palettegen=stats_mode=single[p];[b][p]paletteuse=new=1",
+                "-loop", "0"],
+        "webp": ["-c:v", "libwebp", "-quality", "80", "-loop", "0"],
+    }
+
+    def __init__(self, path, size, fps):
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg is None:
+            raise RuntimeError("ffmpeg was not found on PATH; it is needed for GIF and WebP export")
+
+        self.path = path
+        self.frames = 0
+        self.row_bytes = size[0] * 4
+        fmt = os.path.splitext(path)[1][1:]
+        command = [
+            ffmpeg, "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", "bgra", "-s", f"{size[0]}x{size[1]}", "-r", str(fps), "-i", "-",
+            *self.CODECS[fmt], path,
+        ]
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE)
+
+    def write(self, image):
+        # Frames are RGB32, i.e. B, G, R, 0xff bytes, but rows may be padded
+        data = image.constBits()
+        pitch = image.bytesPerLine()
+        if pitch == self.row_bytes:
+            self.process.stdin.write(data)
+        else:
+            for y in range(image.height()):
+                self.process.stdin.write(data[y * pitch:y * pitch + self.row_bytes])
+        self.frames += 1
+
+    def close(self):
+        self.process.stdin.close()
+        if self.process.wait() != 0:
+            raise RuntimeError(f"ffmpeg failed to encode {self.path}")
+
+
+WRITERS = {
+    "png": PngSequenceWriter,
+    "gif": FfmpegWriter,
+    "webp": FfmpegWriter,
+}
+
+
+# ---------------- Rendering ----------------
+
+def application():
+    """Return the process's QApplication, creating it on first use."""
+    return QApplication.instance() or QApplication([])
+
+
+def create_view(size):
+    """Return a DiagramView whose viewport is exactly size, rendering without a screen."""
+    view = DiagramView()
+    view.backend = "raster"
+    view.frame_sink = "null"
+    view.frame_cache_mb = 0
+    view.setFrameShape(QFrame.NoFrame)
+    view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+    view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+    view.resize(*size)
+
+    # The viewport only takes the view's size once the view is shown
+    view.show()
+    application().processEvents()
+    return view
+
+
+def output_path(out_dir, name, size, fmt):
+    stem = f"{name.replace(' ', '_')}_{size[0]}x{size[1]}"
+    if fmt == "png":
+        return os.path.join(out_dir, stem)
+    return os.path.join(out_dir, f"{stem}.{fmt}")
+
+
+def export_clip(name, size, fps, seconds, fmt, out_dir):
+    """Render one pattern at one size and write it out; returns (path, frames, seconds taken)."""
+    start = time.perf_counter()
+    app = application()
+    view = create_view(size)
+    # Never started, so no timer runs; frames are drawn by seeking
+    anim = view.animations[name](view)
+    anim.resize_to_view()
+
+    # One loop unless a length is given; frames sample the timeline at fps
+    if seconds is None:
+        seconds = anim.get_timeline().duration / DESIGN_FPS
+    frames = max(1, round(seconds * fps))
+
+    path = output_path(out_dir, name, size, fmt)
+    try:
+        # Created in here, so a writer that fails to start still releases the view
+        writer = WRITERS[fmt](path, size, fps)
+        try:
+            for i in range(frames):
+                anim.seek(i * DESIGN_FPS / fps)
+                backend = anim.backend
+                writer.write(backend.to_qimage(backend.presented))
+        finally:
+            writer.close()
+    finally:
+        anim.dispose()
+        view.deleteLater()
+        app.processEvents()
+
+    return path, writer.frames, time.perf_counter() - start
+
+
+# ---------------- Command line ----------------
+
+def parse_size(text):
+    """Parse WIDTHxHEIGHT (e.g. 1280x720) into a (width, height) tuple; an argparse type."""
+    try:
+        w, h = (int(v) for v in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{text!r} is not a size like 1280x720") from None
+    if w <= 0 or h <= 0:
+        raise argparse.ArgumentTypeError(f"{text!r} must have a positive width and height")
+    return w, h
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--patterns", nargs="+", help="pattern names, e.g. builder \"factory method\" (default: all)")
+    parser.add_argument("--sizes", nargs="+", type=parse_size, default=[(1280, 720)], help="sizes as WIDTHxHEIGHT")
+    parser.add_argument("--fps", type=int, default=30, help="frames per second of the clips")
+    parser.add_argument("--seconds", type=float, help="clip length (default: one loop of each animation)")
+    parser.add_argument("--format", choices=FORMATS, default="gif", help="png writes a directory of frames")
+    parser.add_argument("--out", default="exports", help="output directory")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    args = parser.parse_args()
+
+    available = list(ANIMATIONS)
+    patterns = [name.lower() for name in args.patterns] if args.patterns else available
+    unknown = [name for name in patterns if name not in available]
+    if unknown:
+        parser.error(f"unknown patterns: {', '.join(unknown)} (available: {', '.join(available)})")
+    if args.format != "png" and shutil.which("ffmpeg") is None:
+        parser.error(f"ffmpeg was not found on PATH; it is needed for {args.format} export")
+
+    os.makedirs(args.out, exist_ok=True)
+    jobs = [(name, size, args.fps, args.seconds, args.format, args.out)
+            for name in patterns for size in args.sizes]
+
+    # Qt does not survive fork(), so workers start from a fresh interpreter
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(args.jobs, len(jobs)), mp_context=context) as pool:
+        futures = {pool.submit(export_clip, *job): job for job in jobs}
+        for future in as_completed(futures):
+            name, size = futures[future][:2]
+            path, frames, seconds = future.result()
+            print(f"{name:<18} {size[0]}x{size[1]:<6} {frames:>5} frames  {seconds:6.1f} s  {path}")
+
+
+if __name__ == "__main__":
+    main()
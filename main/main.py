@@ -1,9 +1,19 @@
 import sys
 from PySide6.QtWidgets import QApplication
+from diagnostics.watchdog import Watchdog
 from views.main_window import MainWindow
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    # Stall sampling when DESIGN_PATTERNS_WATCHDOG is set
+    watchdog = Watchdog.from_environment()
     window = MainWindow()
     window.show()
-    sys.exit(app.exec())
+    code = app.exec()
+
+    if watchdog:
+        watchdog.stop()
+        stats = watchdog.stats()
+        print(f"watchdog: {stats['stalls']} stalls, longest {stats['longest_ms']:.0f} ms, "
+              f"{stats['samples']} samples written to {watchdog.save()}", file=sys.stderr)
+    sys.exit(code)
@@ -1,6 +1,8 @@
 from PySide6.QtGui import QSyntaxHighlighter, QTextCharFormat, QColor, QFont
 from PySide6.QtCore import QRegularExpression
 
+from diagnostics.trace import traced
+
 class PythonHighlighter(QSyntaxHighlighter):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -38,6 +40,7 @@ class PythonHighlighter(QSyntaxHighlighter):
         number_format.setForeground(QColor("#B5CEA8"))
         self.rules.append((QRegularExpression(r"\b[0-9]+\b"), number_format))
 
+    @traced("highlight")
     def highlightBlock(self, text):
         for pattern, fmt in self.rules:
             it = pattern.globalMatch(text)
@@ -0,0 +1,64 @@
+import importlib
+from collections.abc import Mapping
+
+from diagnostics.trace import tracer
+
+# Pattern name → "module:Class"; modules are only imported when first looked up
+ANIMATIONS = {
+    # Creational patterns
+    "singleton": "views.pattern_diagrams.creational.singleton:SingletonAnimation",
+    "factory method": "views.pattern_diagrams.creational.factoryMethod:FactoryAnimation",
+    "abstract factory": "views.pattern_diagrams.creational.abstractFactory:AbstractAnimation",
+    "prototype": "views.pattern_diagrams.creational.prototype:PrototypeAnimation",
+    "builder": "views.pattern_diagrams.creational.builder:BuilderAnimation",
+
+    # Structural patterns
+    "adapter": "views.pattern_diagrams.structural.adapter:AdapterAnimation",
+    "bridge": "views.pattern_diagrams.structural.bridge:BridgeAnimation",
+    "composite": "views.pattern_diagrams.structural.composite:CompositeAnimation",
+    "decorator": "views.pattern_diagrams.structural.decorator:DecoratorAnimation",
+    "facade": "views.pattern_diagrams.structural.facade:FacadeAnimation",
+    "flyweight": "views.pattern_diagrams.structural.flyweight:FlyweightAnimation",
+    "proxy": "views.pattern_diagrams.structural.proxy:ProxyAnimation",
+
+    # Behavioral patterns
+    "state": "views.pattern_diagrams.behavioral.state:StateAnimation",
+}
+
+
+class AnimationRegistry(Mapping):
+    """
+    Read-only mapping of pattern names to animation classes that imports each
+    class on first lookup.
+
+    Iterating or testing membership never imports anything, so listing the
+    patterns stays cheap; pygame and the pattern images are only loaded once
+    an animation is actually asked for.
+    """
+
+    def __init__(self, specs=ANIMATIONS):
+        self.specs = dict(specs)
+        self.loaded = {}
+
+    def __getitem__(self, name):
+        cls = self.loaded.get(name)
+        if cls is None:
+            module_name, _, class_name = self.specs[name].partition(":")
+            with tracer.span(f"import {module_name}", "app"):
+                module = importlib.import_module(module_name)
+            cls = self.loaded[name] = getattr(module, class_name)
+        return cls
+
+    def __iter__(self):
+        return iter(self.specs)
+
+    def __len__(self):
+        return len(self.specs)
+
+    def __contains__(self, name):
+        return name in self.specs
+
+    def load_all(self):
+        """Import every animation now, e.g. to warm up before measuring."""
+        for name in self.specs:
+            self[name]
@@ -1,25 +1,11 @@
 from PySide6.QtWidgets import QGraphicsView, QGraphicsScene
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import QEvent, QRect, Qt, QTimer
+from PySide6.QtGui import QColor, QFontDatabase, QFontMetrics, QKeySequence, QShortcut
 import os
 
-# Importing creational patterns
-from .pattern_diagrams.creational.singleton import SingletonAnimation
-from .pattern_diagrams.creational.factoryMethod import FactoryAnimation
-from .pattern_diagrams.creational.abstractFactory import AbstractAnimation
-from .pattern_diagrams.creational.prototype import PrototypeAnimation
-from .pattern_diagrams.creational.builder import BuilderAnimation
-
-# Importing structural patterns
-from .pattern_diagrams.structural.adapter import AdapterAnimation
-from .pattern_diagrams.structural.bridge import BridgeAnimation
-from .pattern_diagrams.structural.composite import CompositeAnimation
-from .pattern_diagrams.structural.decorator import DecoratorAnimation
-from .pattern_diagrams.structural.facade import FacadeAnimation
-from .pattern_diagrams.structural.flyweight import FlyweightAnimation
-from .pattern_diagrams.structural.proxy import ProxyAnimation
-
-# Importing behavioral patterns
-from .pattern_diagrams.behavioral.state import StateAnimation
+from diagnostics.trace import traced, tracer
+
+from .animation_registry import AnimationRegistry
 
 class DiagramView(QGraphicsView):
     def __init__(self):
@@ -33,33 +19,50 @@ class DiagramView(QGraphicsView):
         # Currently running animation
         self.current_anim = None
 
-        # Pattern → Animation class mapping
-        self.animations = {
-            "singleton": SingletonAnimation,
-            "factory method": FactoryAnimation,
-            "abstract factory": AbstractAnimation,
-            "prototype": PrototypeAnimation,
-            "builder": BuilderAnimation,
-            "adapter": AdapterAnimation,
-            "bridge": BridgeAnimation,
-            "composite": CompositeAnimation,
-            "decorator": DecoratorAnimation,
-            "facade": FacadeAnimation,
-            "flyweight": FlyweightAnimation,
-            "proxy": ProxyAnimation,
-            "state": StateAnimation,
-        }
+        # Animation rendering backend: "raster" (pygame frames) or "scene" (Qt items)
+        self.backend = os.environ.get("DESIGN_PATTERNS_BACKEND", "raster")
+
+        # Where the raster backend puts frames: "item", "pixmap", "background" or "null"
+        self.frame_sink = os.environ.get("DESIGN_PATTERNS_FRAME_SINK", "item")
+
+        # Memory budget in MB for replaying loops from cached frames (0 disables the cache)
+        self.frame_cache_mb = int(os.environ.get("DESIGN_PATTERNS_FRAME_CACHE", "0"))
+
+        # Playback speed applied to every animation (0.25x-4x)
+        self.playback_rate = 1.0
+
+        # Sink painting frames in drawBackground, if that sink is in use
+        self.background_sink = None
 
+        # Native window watched for expose/occlusion changes
+        self.watched_window = None
+
+        # Frame statistics overlay, toggled with F3; refreshed only while shown
+        self.hud_font = QFontDatabase.systemFont(QFontDatabase.FixedFont)
+        self.hud_rect = QRect()
+        self.hud_timer = QTimer(self)
+        self.hud_timer.setInterval(250)
+        self.hud_timer.timeout.connect(self.refresh_hud)
+        self.hud_shortcut = QShortcut(QKeySequence("F3"), self)
+        self.hud_shortcut.activated.connect(self.toggle_hud)
+        self.hud = False
+        self.set_hud_visible(os.environ.get("DESIGN_PATTERNS_HUD") == "1")
+
+        # Pattern → Animation class mapping, imported on first use
+        self.animations = AnimationRegistry()
+
+    @traced("app")
     def draw_pattern_from_data(self, pattern_data):
         """Load diagram image or animation based on pattern name"""
-        # Clear previous
-        self.scene.clear()
-
-        # Stop previous animation
+        # Dispose of the previous animation while its items are still in the scene
         if self.current_anim:
-            self.current_anim.timer.stop()
+            self.current_anim.dispose()
             self.current_anim = None
 
+        # Clear previous
+        self.scene.clear()
+        self.background_sink = None
+
         pattern_name = (pattern_data.get("name") or
                         pattern_data.get("pattern_name") or
                         "Unknown").lower()
@@ -68,13 +71,148 @@ class DiagramView(QGraphicsView):
         anim_class = self.animations.get(pattern_name)
 
         if anim_class:
-            self.current_anim = anim_class(self)
-            QTimer.singleShot(0, self.current_anim.resize_to_view)
+            with tracer.span(f"{anim_class.__name__}.__init__", "app"):
+                self.current_anim = anim_class(self)
+            self.update_animation_activity()
+            # Start once the viewport has its size; the view, not the animation,
+            # receives the callback so a pattern switch before then cannot revive it
+            QTimer.singleShot(0, self.start_animation)
         else:
             self.scene.addText(f"Diagram for {pattern_name} not found.")
 
+    def start_animation(self):
+        """Start the current animation, if there is one and it is not running yet."""
+        if self.current_anim and not self.current_anim.running:
+            with tracer.span(f"{type(self.current_anim).__name__}.start", "app"):
+                self.current_anim.start()
+
+    def drawBackground(self, painter, rect):
+        super().drawBackground(painter, rect)
+
+        if self.background_sink is not None:
+            self.background_sink.paint(painter, rect)
+
+    def set_playback_rate(self, rate):
+        """Change the playback speed of the current and future animations."""
+        self.playback_rate = rate
+        if self.current_anim:
+            self.current_anim.set_playback_rate(rate)
+
+    # ---------------- Frame statistics ----------------
+
+    def frame_stats(self):
+        """Return the current animation's frame statistics (see PatternAnimation.stats), or None."""
+        if self.current_anim is None:
+            return None
+        return self.current_anim.stats()
+
+    def set_hud_visible(self, visible):
+        """Show or hide the frame statistics overlay."""
+        self.hud = visible
+        if visible:
+            self.hud_timer.start()
+        else:
+            self.hud_timer.stop()
+        self.refresh_hud()
+
+    def toggle_hud(self):
+        self.set_hud_visible(not self.hud)
+
+    def refresh_hud(self):
+        """Repaint the overlay's area; drawForeground records its new size for the next refresh."""
+        if self.hud_rect.isNull():
+            self.viewport().update()
+        else:
+            self.viewport().update(self.hud_rect)
+
+    def hud_lines(self, stats):
+        """Format frame statistics as the overlay's lines of text."""
+        latency = stats["latency_ms"]
+        lines = [
+            f"{stats['fps']:5.1f} fps   {stats['ticks']} ticks   {stats['dropped_ticks']} dropped",
+            f"loop latency {latency['mean']:5.2f} ms avg {latency['max']:6.2f} max",
+            f"{'stage':<10}{'avg ms':>8}{'max ms':>8}",
+        ]
+        for stage, times in stats["stages"].items():
+            lines.append(f"{stage:<10}{times['mean']:>8.3f}{times['max']:>8.3f}")
+
+        backend = stats["backend"]
+        if "presented" in backend:
+            lines.append(f"presented {backend['presented']}   elided {backend['elided']} ({backend['elided_rate']:.0%})")
+            lines.append(f"sink paint {backend['sink']['paint_ms']:.3f} ms avg")
+            labels = backend["labels"]
+            lines.append(f"labels {labels['hit_rate']:.0%} hits   {labels['size']} cached")
+        if "frame_cache" in backend:
+            cache = backend["frame_cache"]
+            lines.append(f"frame cache {cache['hit_rate']:.0%} hits   {cache['bytes'] / 2**20:.1f} MB")
+        if "items" in backend:
+            lines.append(f"scene items {backend['items']}   pixmaps {backend['pixmaps']}")
+        assets = stats["assets"]
+        lines.append(f"assets {assets['hit_rate']:.0%} hits   {assets['files']} files {assets['bytes'] / 2**20:.1f} MB"
+                     f"   {assets['mapped']} mapped")
+        return lines
+
+    def drawForeground(self, painter, rect):
+        super().drawForeground(painter, rect)
+
+        if not self.hud or self.current_anim is None:
+            return
+
+        lines = self.hud_lines(self.frame_stats())
+        metrics = QFontMetrics(self.hud_font)
+        width = max(metrics.horizontalAdvance(line) for line in lines)
+        margin = 6
+
+        # Drawn in viewport coordinates, in the top-left corner
+        painter.save()
+        painter.resetTransform()
+        painter.setFont(self.hud_font)
+        self.hud_rect = QRect(0, 0, width + 2 * margin, len(lines) * metrics.height() + 2 * margin)
+        painter.fillRect(self.hud_rect, QColor(0, 0, 0, 170))
+        painter.setPen(QColor(255, 255, 255))
+        for i, line in enumerate(lines):
+            painter.drawText(margin, margin + metrics.ascent() + i * metrics.height(), line)
+        painter.restore()
+
+    # ---------------- Visibility ----------------
+
+    def can_show_frames(self):
+        """Return whether animation frames would currently be visible at all."""
+        window = self.window()
+        handle = window.windowHandle()
+        viewport = self.viewport()
+        return (self.isVisible()
+                and not window.isMinimized()
+                and (handle is None or handle.isExposed())
+                and viewport.width() > 0 and viewport.height() > 0)
+
+    def update_animation_activity(self):
+        """Suspend the animation while it cannot be seen and resume it on expose."""
+        if self.current_anim:
+            self.current_anim.set_suspended(not self.can_show_frames())
+
+    def showEvent(self, event):
+        super().showEvent(event)
+
+        # Occlusion is only reported to the native window, so watch it too
+        handle = self.window().windowHandle()
+        if handle is not None and handle is not self.watched_window:
+            handle.installEventFilter(self)
+            self.watched_window = handle
+        self.update_animation_activity()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.update_animation_activity()
+
+    def eventFilter(self, watched, event):
+        if watched is self.watched_window and event.type() in (QEvent.Expose, QEvent.WindowStateChange):
+            self.update_animation_activity()
+        return super().eventFilter(watched, event)
+
     def resizeEvent(self, event):
         super().resizeEvent(event)
+        self.update_animation_activity()
 
         if self.current_anim:
             # Let the active animation resize itself
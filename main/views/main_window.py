@@ -63,6 +63,13 @@ class MainWindow(QMainWindow):
         self.pattern_combo.setFont(QFont("Arial", 12))
         self.pattern_combo.addItem("-- Select pattern --")
 
+        self.speed_combo = QComboBox()
+        self.speed_combo.setMinimumHeight(35)
+        self.speed_combo.setCursor(QCursor(QtCore.Qt.PointingHandCursor))
+        self.speed_combo.setFont(QFont("Arial", 12))
+        self.speed_combo.addItems(["0.25x", "0.5x", "1x", "2x", "4x"])
+        self.speed_combo.setCurrentText("1x")
+
         self.message_label = QLabel("")
         self.message_label.setFont(QFont("Arial", 12, QFont.Bold))
         self.message_label.setStyleSheet("color: red;")
@@ -85,6 +92,7 @@ class MainWindow(QMainWindow):
         left_layout.addWidget(self.type_combo)
         left_layout.addWidget(self.pattern_combo)
         left_layout.addWidget(self.run_button)
+        left_layout.addWidget(self.speed_combo)
         left_layout.addWidget(self.message_label)
         left_layout.addStretch()
         left_panel.setLayout(left_layout)
@@ -120,7 +128,8 @@ class MainWindow(QMainWindow):
             message_label=self.message_label,
             type_combo=self.type_combo,
             pattern_combo=self.pattern_combo,
-            run_button=self.run_button
+            run_button=self.run_button,
+            speed_combo=self.speed_combo
         )
         self.controller = PatternController(data, view)
 
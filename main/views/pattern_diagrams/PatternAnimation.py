@@ -1,7 +1,15 @@
+import math
+import time
 import pygame
-from PySide6.QtWidgets import QLabel, QGraphicsProxyWidget
 from PySide6.QtCore import QTimer
-from PySide6.QtGui import QImage, QPixmap
+
+from assets.manager import AssetManager
+from diagnostics.trace import tracer
+
+from .frame_profiler import FrameProfiler
+from .pygame_runtime import PygameRuntime
+from .raster_backend import RasterBackend
+from .scene_backend import SceneBackend
 
 class PatternAnimation:
     """Base class for pattern animations rendered inside DiagramView."""
@@ -9,68 +17,298 @@ class PatternAnimation:
     DESIGN_WIDTH = 1280
     DESIGN_HEIGHT = 720
 
+    # Animations advance in fixed steps of 1/60 s of playback time
+    STEP = 1 / 60
+
+    # Steps a single tick may catch up on before the backlog is dropped
+    MAX_STEPS_PER_TICK = 30
+
+    # Supported playback rates
+    MIN_RATE = 0.25
+    MAX_RATE = 4.0
+
+    # Rendering backends selectable through DiagramView.backend
+    BACKENDS = {
+        "raster": RasterBackend,
+        "scene": SceneBackend,
+    }
+
     def __init__(self, view: "DiagramView", fps: int = 60):
         self.view = view
 
-        # QLabel inside DiagramView scene
-        self.label = QLabel()
-        self.label.setScaledContents(True)
-        self.proxy: QGraphicsProxyWidget = self.view.scene.addWidget(self.label)
+        # Stage timings, frame rate and tick health, read through stats()
+        self.profiler = FrameProfiler()
+
+        # pygame's font module, initialised once per process
+        PygameRuntime.get()
+
+        # Backend that turns draw calls into what DiagramView shows
+        self.backend = self.BACKENDS[getattr(view, "backend", "raster")](self)
+
+        # Position on the animation's timeline, in design frames (1/60 s steps)
+        self.time = 0
+        self.timeline = None
+        self.paused = False
+
+        # Scaled sprites keyed by (source image, target size), cleared on resize
+        self.scaled_cache = {}
+
+        # Lifecycle: ticking only happens between start() and stop()/dispose()
+        self.running = False
+        self.disposed = False
+
+        # Ticking stops while the view cannot show frames (see set_suspended)
+        self.suspended = False
+
+        # Time base: playback seconds not yet simulated, and how far into the
+        # next step the clock is (0..1), for interpolating between steps
+        self.playback_rate = getattr(view, "playback_rate", 1.0)
+        self.last_tick = time.monotonic()
+        self.accumulator = 0.0
+        self.alpha = 0.0
+
+        # Set while tick() runs its steps; only the last step's frame is drawn
+        self.stepping = False
+
+        # Frames skipped by hold(), added to the time when ticking resumes
+        self.held_frames = 0
+        self.hold_started = 0.0
+        self.hold_timer = QTimer()
+        self.hold_timer.setSingleShot(True)
+        self.hold_timer.timeout.connect(self.release_hold)
 
         # Timer for frame updates
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_frame)
-        self.timer.start(1000 // fps)
+        self.interval = 1000 // fps
+        self.timer = self.backend.create_timer()
+        self.timer.timeout.connect(self.tick)
+
+    # ---------------- Lifecycle ----------------
+
+    def start(self):
+        """Lay out for the current view size and start ticking."""
+        if self.disposed:
+            return
+
+        self.resize_to_view()
+        self.running = True
+        if not self.paused:
+            self.start_timer()
+
+    def stop(self):
+        """Stop ticking; start() resumes from the current frame."""
+        self.running = False
+        self.stop_timer()
+
+    def dispose(self):
+        """
+        Stop for good and release what the animation holds outside itself:
+        timer connections, scene items, render targets and cached sprites.
+        Call it before the scene is cleared, while the items still exist.
+        """
+        if self.disposed:
+            return
+
+        self.stop()
+        self.timer.timeout.disconnect(self.tick)
+        self.hold_timer.timeout.disconnect(self.release_hold)
+        self.backend.dispose()
+        self.scaled_cache.clear()
+        self.timeline = None
+        self.disposed = True
+
+    # ---------------- Ticking ----------------
+
+    def start_timer(self):
+        """Start ticking, unless stopped or the view is currently unable to show frames."""
+        if self.running and not self.suspended:
+            # Time spent stopped is not played back
+            self.last_tick = time.monotonic()
+            self.accumulator = 0.0
+            self.timer.start(self.interval)
+
+    def stop_timer(self):
+        """Stop ticking, including the restart a pending hold would do."""
+        self.timer.stop()
+        self.hold_timer.stop()
+        self.held_frames = 0
+
+    def tick(self):
+        """
+        Advance by the steps the clock has covered since the last tick, then
+        present. While a track is changing, the frame may be drawn where the
+        clock is between steps (see interpolates), so slow playback still
+        moves on every tick.
+        """
+        tick_start = time.perf_counter()
+        now = time.monotonic()
+        self.profiler.record_tick(now - self.last_tick, self.interval / 1000)
+        self.accumulator += (now - self.last_tick) * self.playback_rate
+        self.last_tick = now
+
+        steps = int(self.accumulator / self.STEP)
+        self.accumulator -= steps * self.STEP
+        if steps > self.MAX_STEPS_PER_TICK:
+            # Too far behind (e.g. a stalled event loop): jump ahead instead
+            steps = self.MAX_STEPS_PER_TICK
+            self.accumulator = 0.0
+
+        # Steps only advance the time; the frame they end on is drawn once
+        self.stepping = True
+        try:
+            for done in range(1, steps + 1):
+                self.update_frame()
+                if not self.timer.isActive():
+                    # Paused or held; a hold plays the remaining steps back when it ends
+                    self.accumulator += (steps - done) * self.STEP
+                    break
+        finally:
+            self.stepping = False
+
+        # A hold means the frames ahead are constant, so only running ticks interpolate
+        self.alpha = self.accumulator / self.STEP if self.timer.isActive() else 0.0
+        t = self.time
+        if self.alpha and self.interpolates() and self.get_timeline().next_change(self.time) == self.time:
+            t += self.alpha
+
+        if (steps or t != self.time) and not self.paused:
+            self.draw_at(t)
+
+        if tracer.enabled:
+            tracer.complete("tick", "frame", tick_start, {"steps": steps})
+
+    def interpolates(self):
+        """
+        Return whether frames are drawn between steps. Below 1x a step spans
+        several ticks, so they are; at 1x and above nearly every tick reaches a
+        new step anyway, and snapping to it keeps the frame cache usable.
+        """
+        return self.playback_rate < 1 or getattr(self.backend, "frame_cache", None) is None
+
+    def set_playback_rate(self, rate):
+        """Play back at rate times normal speed (clamped to 0.25x-4x)."""
+        if self.held_frames:
+            self.release_hold()
+        self.playback_rate = min(max(rate, self.MIN_RATE), self.MAX_RATE)
+
+    def step_ms(self, steps):
+        """Return the wall-clock milliseconds that a number of steps take at the current rate."""
+        return math.ceil(steps * self.STEP * 1000 / self.playback_rate)
+
+    def set_suspended(self, suspended):
+        """Stop ticking while the view is hidden, minimised or zero-sized; resume on expose."""
+        if suspended == self.suspended:
+            return
 
-        # Frame tracking
-        self.frame_count = 0
-        self.phase = 0
+        self.suspended = suspended
+        if suspended:
+            self.timer.stop()
+        elif not self.paused and not self.held_frames:
+            self.start_timer()
+
+    def hold(self, frames):
+        """Stop ticking for a number of frames that would look exactly like the last one."""
+        if frames <= 0 or not self.timer.isActive():
+            return
+
+        self.timer.stop()
+        self.held_frames = frames
+        self.hold_started = time.monotonic()
+        self.hold_timer.start(self.step_ms(frames))
+
+    def release_hold(self):
+        """Count the frames that passed during a hold and start ticking again."""
+        self.hold_timer.stop()
+        elapsed = (time.monotonic() - self.hold_started) * self.playback_rate + self.accumulator
+        frames = min(self.held_frames, int(elapsed / self.STEP))
+        self.time = self.get_timeline().wrap(self.time + frames)
+        self.held_frames = 0
+        self.start_timer()
+
+        # Time past the held frames (e.g. a late timer) is caught up by the next tick
+        self.accumulator = elapsed - frames * self.STEP
+
+    def cancel_hold(self):
+        """End a hold without counting the frames it skipped."""
+        self.hold_timer.stop()
+        if self.held_frames:
+            self.held_frames = 0
+            self.start_timer()
+
+    # ---------------- Playback control ----------------
+
+    def pause(self):
+        """Freeze on the current frame."""
+        self.paused = True
+        self.stop_timer()
+
+    def play(self):
+        """Continue from the current frame."""
         self.paused = False
+        self.start_timer()
+
+    def seek(self, t):
+        """Show the frame at time t (design frames) without replaying the frames before it."""
+        self.cancel_hold()
+        self.time = self.get_timeline().wrap(t)
+        self.draw_at(self.time)
 
-        # Fonts
-        pygame.init()
-        self.font = pygame.font.SysFont("Arial", 24, bold=True)
+    def seek_marker(self, name):
+        """Jump to a named point of the timeline, e.g. the start of a phase."""
+        self.seek(self.get_timeline().marker(name))
+
+    def step(self, frames=1):
+        """Pause and move by a number of frames; negative values step backwards."""
+        self.pause()
+        self.seek(self.time + frames)
 
     # ---------------- Layout & scaling ----------------
 
     def resize_to_view(self):
-        """Resize QLabel to exactly match the DiagramView viewport without expanding the scene."""
-        w, h = self.view.viewport().width(), self.view.viewport().height()
+        """Resize the backend to exactly match the DiagramView viewport without expanding the scene."""
+        w, h = self.view_size()
         if w <= 0 or h <= 0:
             return
+        start = time.perf_counter()
+
+        # A held frame is stale at the new size, so draw the next one now
+        if self.held_frames:
+            self.release_hold()
 
-        self.label.resize(w, h)
-        self.proxy.setPos(0, 0)
         self.view.setSceneRect(0, 0, w, h)
+        self.scaled_cache.clear()
+        self.backend.resize(w, h)
 
         if hasattr(self, "reset_positions"):
             self.reset_positions()
+        self.timeline = None
+        self.backend.build_static_layer()
+        self.profiler.add("layout", start)
 
-    def create_surface(self):
-        """Create a transparent surface sized to DiagramView."""
-        w, h = self.view.width(), self.view.height()
-        return pygame.Surface((w, h), pygame.SRCALPHA)
+        # Nothing else would redraw a paused animation at the new size
+        if self.paused:
+            self.draw_at(self.time)
 
-    @staticmethod
-    def to_qimage(surface):
-        """Convert Pygame surface to QImage."""
-        w, h = surface.get_size()
-        data = pygame.image.tostring(surface, "RGBA")
-        return QImage(data, w, h, QImage.Format_RGBA8888)
+    def view_size(self):
+        """Return the viewport size, which is also the size of the rendered frames."""
+        viewport = self.view.viewport()
+        return viewport.width(), viewport.height()
+
+    def create_surface(self):
+        """Return the backend's render target for this frame."""
+        return self.backend.begin_frame()
 
-    def finalize_frame(self, surface):
-        """Render pygame surface into QLabel (end of each update_frame)."""
-        qimg = self.to_qimage(surface)
-        self.label.setPixmap(QPixmap.fromImage(qimg))
+    def finalize_frame(self, surface, t=None):
+        """Present the frame, which shows time t of the timeline (if known)."""
+        self.backend.end_frame(surface, t)
 
     def scale_factor(self):
         """Return scaling factors relative to design resolution."""
-        w, h = self.view.width(), self.view.height()
+        w, h = self.view_size()
         return w / self.DESIGN_WIDTH, h / self.DESIGN_HEIGHT
 
     def reset_positions(self):
         """Compute absolute pixel positions from relative config."""
-        w, h = self.view.width(), self.view.height()
+        w, h = self.view_size()
         sx, sy = self.scale_factor()
 
         self.positions = {}
@@ -86,14 +324,18 @@ class PatternAnimation:
 
     # ---------------- Drawing helpers ----------------
 
+    def render_text(self, text, color=(255, 255, 255)):
+        """Return a text label the backend's render target can blit."""
+        return self.backend.render_text(text, color)
+
     def draw_labels(self, surface, labels: dict, color=(255, 255, 255)):
         """Draw text labels above elements."""
         for text, pos in labels.items():
-            surface.blit(self.font.render(text, True, color), pos)
+            surface.blit(self.render_text(text, color), pos)
 
     def draw_message(self, surface, text, color, anchor_rect, margin=20):
         """Draw a centered message below an element (like socket)."""
-        msg = self.font.render(text, True, color)
+        msg = self.render_text(text, color)
         msg_pos = (
             anchor_rect[0] + anchor_rect[2] // 2 - msg.get_width() // 2,
             anchor_rect[1] + anchor_rect[3] + margin
@@ -104,14 +346,17 @@ class PatternAnimation:
     def draw_growing_arrow(surface, start, end, progress,
                            color=(255, 255, 255), thickness=6, arrow_size=12):
         """Draw animated arrow from start to end with progress-based growth."""
+        if progress <= 0:
+            return
+
         dx, dy = end[0] - start[0], end[1] - start[1]
-        length = max(1, (dx ** 2 + dy ** 2) ** 0.5)
+        length = PatternAnimation.arrow_length(start, end)
         ux, uy = dx / length, dy / length
         current_len = min(progress, length)
         mid = (start[0] + ux * current_len, start[1] + uy * current_len)
 
         # Line grows with progress
-        pygame.draw.line(surface, color, start, mid, thickness)
+        surface.draw_line(color, start, mid, thickness)
 
         # Arrow head appears when full length reached
         if progress >= length:
@@ -120,7 +365,13 @@ class PatternAnimation:
                   end[1] - uy * arrow_size + perp[1] * arrow_size / 2)
             p2 = (end[0] - ux * arrow_size - perp[0] * arrow_size / 2,
                   end[1] - uy * arrow_size - perp[1] * arrow_size / 2)
-            pygame.draw.polygon(surface, color, [end, p1, p2])
+            surface.draw_polygon(color, [end, p1, p2])
+
+    @staticmethod
+    def arrow_length(start, end):
+        """Length draw_growing_arrow needs to grow to before it draws the head."""
+        dx, dy = end[0] - start[0], end[1] - start[1]
+        return max(1, (dx ** 2 + dy ** 2) ** 0.5)
 
     @staticmethod
     def get_center(pos, surface, y_anchor="center"):
@@ -162,30 +413,91 @@ class PatternAnimation:
 
     # ---------------- Animation helpers ----------------
 
-    @staticmethod
-    def move_linear(start_pos, frame, speed, max_frames, final_offset=(0, 0)):
-        """Animate X movement for limited frames, else snap to the final offset."""
-        if frame < max_frames:
-            return start_pos[0] + int(frame * speed), start_pos[1]
-        return start_pos[0] + final_offset[0], start_pos[1] + final_offset[1]
+    def load_image(self, *path):
+        """Return a diagram image shared by all animations, e.g. load_image("structural_patterns/adapter", "adapter.png")."""
+        return AssetManager.get().image("/".join(path))
 
     def scale_image(self, image, width, height):
         """Scale an image based on view scaling factors."""
         sx, sy = self.scale_factor()
-        return pygame.transform.scale(image, (int(width * sx), int(height * sy)))
+        return self.scale_to(image, (int(width * sx), int(height * sy)))
+
+    def scale_to(self, image, size):
+        """Return the image smoothly scaled to an absolute size, cached until the next resize."""
+        key = (image, size)
+        scaled = self.scaled_cache.get(key)
+        if scaled is None:
+            start = time.perf_counter()
+            # From the nearest larger mip level, not the full-size source
+            source = AssetManager.get().scale_source(image, size)
+            scaled = pygame.transform.smoothscale(source, size)
+            self.scaled_cache[key] = scaled
+            self.profiler.add("scale", start)
+        return scaled
 
-    # in PatternAnimation
-    @staticmethod
-    def move_towards(current, target, step):
-        """Move a numeric value (x or y) towards the target with a fixed step."""
-        if current < target:
-            return current + min(step, target - current)
-        elif current > target:
-            return current - min(step, current - target)
-        return current
+    # ---------------- Timeline ----------------
 
-    # ---------------- To Override ----------------
+    def get_timeline(self):
+        """Return the timeline, building it for the current view size if needed."""
+        if self.timeline is None:
+            self.timeline = self.build_timeline()
+        return self.timeline
 
     def update_frame(self):
-        """Subclasses must override this to draw their animation frame."""
+        """Advance one design frame and draw the timeline there."""
+        if self.paused:
+            return
+
+        timeline = self.get_timeline()
+        self.time = timeline.wrap(self.time + 1)
+        if not self.stepping:
+            self.draw_at(self.time)
+
+        # Frames before the next keyframe look the same, so stop ticking until then
+        change = timeline.next_change(self.time)
+        if change is not None:
+            self.hold(math.ceil(change) - self.time - 1)
+
+    def draw_at(self, t):
+        """Draw and present the frame at time t, from the backend's frame cache if it has it."""
+        frame_start = start = time.perf_counter()
+        surface = self.create_surface()
+        self.profiler.add("surface", start)
+
+        # Only whole steps recur exactly every loop, so only they go through the frame cache
+        key = t if t == int(t) else None
+
+        if key is None or not self.backend.draw_cached(surface, key):
+            start = time.perf_counter()
+            state = self.get_timeline().evaluate(t)
+            self.profiler.add("evaluate", start)
+
+            start = time.perf_counter()
+            self.draw_frame(surface, state)
+            self.profiler.add("draw", start)
+        self.finalize_frame(surface, key)
+
+        if tracer.enabled:
+            tracer.complete(type(self).__name__, "frame", frame_start, {"t": t})
+
+    # ---------------- Instrumentation ----------------
+
+    def stats(self):
+        """Return frame rate, tick health, stage timings, the backend's and the asset manager's counters; cheap to poll."""
+        stats = self.profiler.stats()
+        stats["backend"] = self.backend.stats()
+        stats["assets"] = AssetManager.get().stats()
+        return stats
+
+    # ---------------- To Override ----------------
+
+    def draw_static(self, surface):
+        """Subclasses may override this to draw elements that never move."""
+
+    def build_timeline(self):
+        """Subclasses must override this to return their Timeline for the current positions."""
+        raise NotImplementedError
+
+    def draw_frame(self, surface, state):
+        """Subclasses must override this to draw a frame from the track values in state."""
         raise NotImplementedError
@@ -1,6 +1,5 @@
-import os
-import pygame
 from ..PatternAnimation import PatternAnimation
+from ..timeline import Timeline, Track, growth
 
 class AbstractAnimation(PatternAnimation):
     """Abstract Factory pattern animation."""
@@ -9,28 +8,23 @@ class AbstractAnimation(PatternAnimation):
         super().__init__(view)
 
         # Load resources
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        base_path = os.path.normpath(
-            os.path.join(current_dir, "../../../../main/resources/diagrams/creational_patterns/abstract_factory/")
-        )
+        base_path = "creational_patterns/abstract_factory"
         self.imgs = {
-            "factory": pygame.image.load(os.path.join(base_path, "factory.png")),
-            "classic_chair": pygame.image.load(os.path.join(base_path, "classic_chair.png")),
-            "classic_sofa": pygame.image.load(os.path.join(base_path, "classic_sofa.png")),
-            "modern_chair": pygame.image.load(os.path.join(base_path, "modern_chair.png")),
-            "modern_sofa": pygame.image.load(os.path.join(base_path, "modern_sofa.png")),
+            "factory": self.load_image(base_path, "factory.png"),
+            "classic_chair": self.load_image(base_path, "classic_chair.png"),
+            "classic_sofa": self.load_image(base_path, "classic_sofa.png"),
+            "modern_chair": self.load_image(base_path, "modern_chair.png"),
+            "modern_sofa": self.load_image(base_path, "modern_sofa.png"),
         }
 
         # Init
         self.reset_positions()
-        self.frame_count = 0
-        self.paused = False
 
     # ---------------- Helpers ----------------
 
     def reset_positions(self):
         """Set positions for factory and product families."""
-        w, h = self.view.width(), self.view.height()
+        w, h = self.view_size()
         sx, sy = self.scale_factor()
 
         # Main factory at top
@@ -60,55 +54,56 @@ class AbstractAnimation(PatternAnimation):
                 modern_chair, self.modern_chair_pos,
                 modern_sofa, self.modern_sofa_pos)
 
-    # ---------------- Frame Update ----------------
-
-    def update_frame(self):
-        if self.paused:
-            return
-
-        surface = self.create_surface()
-        (factory_img, factory_pos,
-         classic_chair_img, classic_chair_pos,
-         classic_sofa_img, classic_sofa_pos,
-         modern_chair_img, modern_chair_pos,
-         modern_sofa_img, modern_sofa_pos) = self.scale_elements()
-
-        # Draw factory
+    def draw_static(self, surface):
+        """The factory never moves."""
+        factory_img, factory_pos = self.scale_elements()[:2]
         surface.blit(factory_img, factory_pos)
 
+    def arrows(self):
+        """Return the (start, end) points of the factory -> family arrows."""
+        factory_img, factory_pos = self.scale_elements()[:2]
+
         # Start point: bottom center of the factory
         factory_center = (factory_pos[0] + factory_img.get_width() // 2,
                           factory_pos[1] + factory_img.get_height())
 
-        self.frame_count += 1
-        progress = self.frame_count * 15  # arrow growth speed
-
-        # Step 1: branching arrows to groups
         classic_group_center = (self.classic_group_pos[0] + 100, self.classic_group_pos[1] - 20)
         modern_group_center = (self.modern_group_pos[0] + 100, self.modern_group_pos[1] - 20)
+        return [(factory_center, classic_group_center), (factory_center, modern_group_center)]
+
+    # ---------------- Timeline ----------------
 
-        self.draw_growing_arrow(surface, factory_center, classic_group_center, progress)
-        self.draw_growing_arrow(surface, factory_center, modern_group_center, progress)
+    def build_timeline(self):
+        length = max(self.arrow_length(*arrow) for arrow in self.arrows())
+        return Timeline(301, {
+            # Step 1: branching arrows to groups
+            "arrows": Track.linear(*growth(0, 15, length)),
+            # Step 2: show furniture
+            "furniture": Track.after(21),
+            # Step 3: group labels
+            "labels": Track.after(41),
+        }, markers={"furniture": 21, "labels": 41})
 
-        # Step 2: show furniture
-        if self.frame_count > 20:
+    # ---------------- Frame Update ----------------
+
+    def draw_frame(self, surface, state):
+        (classic_chair_img, classic_chair_pos,
+         classic_sofa_img, classic_sofa_pos,
+         modern_chair_img, modern_chair_pos,
+         modern_sofa_img, modern_sofa_pos) = self.scale_elements()[2:]
+
+        for start, target in self.arrows():
+            self.draw_growing_arrow(surface, start, target, state["arrows"])
+
+        if state["furniture"]:
             surface.blit(classic_chair_img, classic_chair_pos)
             surface.blit(classic_sofa_img, classic_sofa_pos)
             surface.blit(modern_chair_img, modern_chair_pos)
             surface.blit(modern_sofa_img, modern_sofa_pos)
 
-        # Step 3: group labels
-        if self.frame_count > 40:
+        if state["labels"]:
             labels = {
                 "Creates Victorian Furniture": (classic_chair_pos[0], classic_chair_pos[1] + 120),
                 "Creates Modern Furniture": (modern_sofa_pos[0], modern_sofa_pos[1] + 120),
             }
             self.draw_labels(surface, labels)
-
-        # Loop reset
-        if self.frame_count > 300:
-            self.frame_count = 0
-            self.reset_positions()
-
-        # Finalize
-        self.finalize_frame(surface)
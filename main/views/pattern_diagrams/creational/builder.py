@@ -1,6 +1,5 @@
-import os
-import pygame
 from ..PatternAnimation import PatternAnimation
+from ..timeline import Timeline, Track, growth
 
 class BuilderAnimation(PatternAnimation):
     """Builder pattern animation drawn directly into the DiagramView."""
@@ -9,27 +8,22 @@ class BuilderAnimation(PatternAnimation):
         super().__init__(view)
 
         # Load resources
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        base_path = os.path.normpath(
-            os.path.join(current_dir, "../../../../main/resources/diagrams/creational_patterns/builder/")
-        )
+        base_path = "creational_patterns/builder"
         self.imgs = {
-            "architect": pygame.image.load(os.path.join(base_path, "architect.png")),
-            "house": pygame.image.load(os.path.join(base_path, "house.png")),
-            "classic": pygame.image.load(os.path.join(base_path, "classic_house.png")),
-            "modern": pygame.image.load(os.path.join(base_path, "modern_house.png")),
+            "architect": self.load_image(base_path, "architect.png"),
+            "house": self.load_image(base_path, "house.png"),
+            "classic": self.load_image(base_path, "classic_house.png"),
+            "modern": self.load_image(base_path, "modern_house.png"),
         }
 
         # Initialize
         self.reset_positions()
-        self.frame_count = 0
-        self.paused = False
 
     # ---------------- Helpers ----------------
 
     def reset_positions(self):
         """Set positions for architect, generic house, and final houses."""
-        w, h = self.view.width(), self.view.height()
+        w, h = self.view_size()
         sx, sy = self.scale_factor()
 
         self.architect_pos = (int(w * 0.5 - 60 * sx), int(40 * sy))
@@ -45,54 +39,69 @@ class BuilderAnimation(PatternAnimation):
         modern = self.scale_image(self.imgs["modern"], 180, 140)
         return architect, house, classic, modern
 
-    # ---------------- Frame Update ----------------
-
-    def update_frame(self):
-        if self.paused:
-            return
-
-        surface = self.create_surface()
-        architect_img, house_img, classic_img, modern_img = self.scale_elements()
-
-        # Draw architect
+    def draw_static(self, surface):
+        """The architect never moves."""
+        architect_img = self.scale_elements()[0]
         surface.blit(architect_img, self.architect_pos)
 
-        # Frame counter
-        self.frame_count += 1
-        progress = self.frame_count * 15  # arrow growth speed
-        arrow_color = (255, 255, 255)
-
-        # Step 1: Architect -> Generic House
+    def arrows(self):
+        """Return the (start, end) points of the architect -> house -> variants arrows."""
+        architect_img, house_img, classic_img, modern_img = self.scale_elements()
         architect_center = (
             self.architect_pos[0] + architect_img.get_width() // 2,
             self.architect_pos[1] + architect_img.get_height()
         )
         house_target = (self.house_pos[0] + house_img.get_width() // 2, self.house_pos[1])
-        self.draw_growing_arrow(surface, architect_center, house_target, progress, arrow_color)
+        house_center = (
+            self.house_pos[0] + house_img.get_width() // 2,
+            self.house_pos[1] + house_img.get_height()
+        )
+        classic_target = (self.classic_house_pos[0] + classic_img.get_width() // 2, self.classic_house_pos[1])
+        modern_target = (self.modern_house_pos[0] + modern_img.get_width() // 2, self.modern_house_pos[1])
+        return {
+            "house": (architect_center, house_target),
+            "classic": (house_center, classic_target),
+            "modern": (house_center, modern_target),
+        }
 
-        # Step 2: Show a generic house
-        if self.frame_count > 20:
+    # ---------------- Timeline ----------------
+
+    def build_timeline(self):
+        arrows = self.arrows()
+        return Timeline(481, {
+            # Step 1: Architect -> Generic House
+            "house_arrow": Track.linear(*growth(0, 15, self.arrow_length(*arrows["house"]))),
+            # Step 2: Show a generic house
+            "house": Track.after(21),
+            # Step 3: Generic house -> Classic + Modern
+            "classic_arrow": Track.linear(*growth(40, 15, self.arrow_length(*arrows["classic"]))),
+            "modern_arrow": Track.linear(*growth(40, 15, self.arrow_length(*arrows["modern"]))),
+            # Step 4: Show final houses
+            "houses": Track.after(61),
+            # Step 5: Labels
+            "labels": Track.after(81),
+        }, markers={"house": 21, "variants": 41, "labels": 81})
+
+    # ---------------- Frame Update ----------------
+
+    def draw_frame(self, surface, state):
+        architect_img, house_img, classic_img, modern_img = self.scale_elements()
+        arrows = self.arrows()
+        arrow_color = (255, 255, 255)
+
+        self.draw_growing_arrow(surface, *arrows["house"], state["house_arrow"], arrow_color)
+
+        if state["house"]:
             surface.blit(house_img, self.house_pos)
 
-        # Step 3: Generic house -> Classic + Modern
-        if self.frame_count > 40:
-            house_center = (
-                self.house_pos[0] + house_img.get_width() // 2,
-                self.house_pos[1] + house_img.get_height()
-            )
-            classic_target = (self.classic_house_pos[0] + classic_img.get_width() // 2, self.classic_house_pos[1])
-            modern_target = (self.modern_house_pos[0] + modern_img.get_width() // 2, self.modern_house_pos[1])
-            progress2 = (self.frame_count - 40) * 15
-            self.draw_growing_arrow(surface, house_center, classic_target, progress2, arrow_color)
-            self.draw_growing_arrow(surface, house_center, modern_target, progress2, arrow_color)
-
-        # Step 4: Show final houses
-        if self.frame_count > 60:
+        self.draw_growing_arrow(surface, *arrows["classic"], state["classic_arrow"], arrow_color)
+        self.draw_growing_arrow(surface, *arrows["modern"], state["modern_arrow"], arrow_color)
+
+        if state["houses"]:
             surface.blit(classic_img, self.classic_house_pos)
             surface.blit(modern_img, self.modern_house_pos)
 
-        # Step 5: Labels
-        if self.frame_count > 80:
+        if state["labels"]:
             labels = {
                 "Director (Architect)": (
                     self.architect_pos[0] + architect_img.get_width() // 2,
@@ -113,13 +122,5 @@ class BuilderAnimation(PatternAnimation):
             }
             # Center-align labels
             for text, (cx, cy) in labels.items():
-                lbl = self.font.render(text, True, arrow_color)
+                lbl = self.render_text(text, arrow_color)
                 surface.blit(lbl, (cx - lbl.get_width() // 2, cy))
-
-        # Loop
-        if self.frame_count > 480:
-            self.frame_count = 0
-            self.reset_positions()
-
-        # Finalize frame
-        self.finalize_frame(surface)
@@ -1,6 +1,5 @@
-import os
-import pygame
 from ..PatternAnimation import PatternAnimation
+from ..timeline import Timeline, Track, growth
 
 class PrototypeAnimation(PatternAnimation):
     """Prototype pattern animation drawn directly into the DiagramView."""
@@ -9,22 +8,17 @@ class PrototypeAnimation(PatternAnimation):
         super().__init__(view)
 
         # Load resources
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        base_path = os.path.normpath(
-            os.path.join(current_dir, "../../../../main/resources/diagrams/creational_patterns/prototype/")
-        )
-        self.key_img_orig = pygame.image.load(os.path.join(base_path, "key.png"))
+        base_path = "creational_patterns/prototype"
+        self.key_img_orig = self.load_image(base_path, "key.png")
 
         # Initialize
         self.reset_positions()
-        self.frame_count = 0
-        self.paused = False
 
     # ---------------- Helpers ----------------
 
     def reset_positions(self):
         """Set positions for the prototype and its clones."""
-        w, h = self.view.width(), self.view.height()
+        w, h = self.view_size()
         sx, sy = self.scale_factor()
 
         # Prototype at the top center
@@ -40,41 +34,49 @@ class PrototypeAnimation(PatternAnimation):
         """Return scaled prototype image."""
         return self.scale_image(self.key_img_orig, 100, 100)
 
-    # ---------------- Frame Update ----------------
-
-    def update_frame(self):
-        if self.paused:
-            return
+    def draw_static(self, surface):
+        """The prototype key never moves."""
+        surface.blit(self.scale_elements(), self.prototype_pos)
 
-        surface = self.create_surface()
+    def arrows(self):
+        """Return the (start, end) points of the prototype -> clone arrows."""
         key_img = self.scale_elements()
 
-        # Draw prototype
-        surface.blit(key_img, self.prototype_pos)
-
         # Start point (bottom center of prototype)
         proto_center = (
             self.prototype_pos[0] + key_img.get_width() // 2,
             self.prototype_pos[1] + key_img.get_height()
         )
+        return [(proto_center, (clone_pos[0] + key_img.get_width() // 2, clone_pos[1]))
+                for clone_pos in self.clone_positions]
+
+    # ---------------- Timeline ----------------
+
+    def build_timeline(self):
+        length = max(self.arrow_length(*arrow) for arrow in self.arrows())
+        return Timeline(361, {
+            # Step 1: arrows towards clones
+            "arrows": Track.linear(*growth(0, 15, length)),
+            # Step 2: draw clones
+            "clones": Track.after(21),
+            # Step 3: labels
+            "labels": Track.after(41),
+        }, markers={"clones": 21, "labels": 41})
 
-        self.frame_count += 1
-        arrow_growth_speed = 15
+    # ---------------- Frame Update ----------------
 
-        # Step 1: arrows towards clones
-        progress = self.frame_count * arrow_growth_speed
-        for clone_pos in self.clone_positions:
-            target = (clone_pos[0] + key_img.get_width() // 2, clone_pos[1])
-            self.draw_growing_arrow(surface, proto_center, target, progress)
+    def draw_frame(self, surface, state):
+        key_img = self.scale_elements()
+
+        for start, target in self.arrows():
+            self.draw_growing_arrow(surface, start, target, state["arrows"])
 
-        # Step 2: draw clones
-        if self.frame_count > 20:
+        if state["clones"]:
             for clone_pos in self.clone_positions:
                 surface.blit(key_img, clone_pos)
 
-        # Step 3: labels
-        if self.frame_count > 40:
-            proto_label = self.font.render("Original", True, (255, 255, 255))
+        if state["labels"]:
+            proto_label = self.render_text("Original", (255, 255, 255))
             surface.blit(
                 proto_label,
                 (self.prototype_pos[0] + key_img.get_width() // 2 - proto_label.get_width() // 2,
@@ -82,17 +84,9 @@ class PrototypeAnimation(PatternAnimation):
             )
 
             for i, clone_pos in enumerate(self.clone_positions, start=1):
-                clone_label = self.font.render(f"Copy {i}", True, (255, 255, 255))
+                clone_label = self.render_text(f"Copy {i}", (255, 255, 255))
                 surface.blit(
                     clone_label,
                     (clone_pos[0] + key_img.get_width() // 2 - clone_label.get_width() // 2,
                      clone_pos[1] + key_img.get_height() + 5)
                 )
-
-        # Loop
-        if self.frame_count > 360:
-            self.frame_count = 0
-            self.reset_positions()
-
-        # Finalize
-        self.finalize_frame(surface)
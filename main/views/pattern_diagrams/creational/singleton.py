@@ -1,7 +1,5 @@
-import os
-import pygame
-from PySide6.QtCore import QTimer
 from ..PatternAnimation import PatternAnimation
+from ..timeline import Timeline, Track
 
 
 class SingletonAnimation(PatternAnimation):
@@ -11,16 +9,13 @@ class SingletonAnimation(PatternAnimation):
         super().__init__(view)
 
         # Load resources
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        base_path = os.path.normpath(
-            os.path.join(current_dir, "../../../../main/resources/diagrams/creational_patterns/singleton/")
-        )
+        base_path = "creational_patterns/singleton"
 
         self.imgs = {
-            "printer": pygame.image.load(os.path.join(base_path, "printer.png")),
-            "man": pygame.image.load(os.path.join(base_path, "man.png")),
-            "woman": pygame.image.load(os.path.join(base_path, "woman.png")),
-            "document": pygame.image.load(os.path.join(base_path, "document.png")),
+            "printer": self.load_image(base_path, "printer.png"),
+            "man": self.load_image(base_path, "man.png"),
+            "woman": self.load_image(base_path, "woman.png"),
+            "document": self.load_image(base_path, "document.png"),
         }
 
         # Movement speed
@@ -32,15 +27,16 @@ class SingletonAnimation(PatternAnimation):
     # ---------------- Helpers ----------------
 
     def reset_positions(self):
-        w, h = self.view.width(), self.view.height()
+        w, h = self.view_size()
         sx, sy = self.scale_factor()
 
         self.printer_pos = (int(w * 0.5 - 75 * sx), int(50 * sy))
         self.man_pos = (int(150 * sx), int(h - 250 * sy))
         self.woman_pos = (int(w - 270 * sx), int(h - 250 * sy))
 
-        self.doc1_pos = [self.man_pos[0] + int(80 * sx), self.man_pos[1] + int(40 * sy)]
-        self.doc2_pos = [self.woman_pos[0] + int(50 * sx), self.woman_pos[1] + int(40 * sy)]
+        # Documents start in the people's hands
+        self.doc1_pos = (self.man_pos[0] + int(80 * sx), self.man_pos[1] + int(40 * sy))
+        self.doc2_pos = (self.woman_pos[0] + int(50 * sx), self.woman_pos[1] + int(40 * sy))
 
     def scale_elements(self):
         """Return scaled images and positions."""
@@ -50,55 +46,55 @@ class SingletonAnimation(PatternAnimation):
         doc_img = self.scale_image(self.imgs["document"], 60, 80)
         return man_img, woman_img, printer_img, doc_img
 
-    # ---------------- Frame Update ----------------
-
-    def update_frame(self):
-        if self.paused:
-            return
-
-        surface = self.create_surface()
-        man_img, woman_img, printer_img, doc_img = self.scale_elements()
-
-        # Draw people + printer
+    def draw_static(self, surface):
+        """People and printer never move."""
+        man_img, woman_img, printer_img, _ = self.scale_elements()
         surface.blit(man_img, self.man_pos)
         surface.blit(woman_img, self.woman_pos)
         surface.blit(printer_img, self.printer_pos)
 
-        # Dynamic target (center of printer)
-        target = (
+    def doc_target(self):
+        """Where both documents end up: the center of the printer."""
+        _, _, printer_img, doc_img = self.scale_elements()
+        return (
             self.printer_pos[0] + printer_img.get_width() // 2 - doc_img.get_width() // 2,
             self.printer_pos[1] + printer_img.get_height() // 2 - doc_img.get_height() // 2,
         )
 
-        # Move docs
-        self.doc1_pos[0] = self.move_towards(self.doc1_pos[0], target[0], self.speed)
-        self.doc1_pos[1] = self.move_towards(self.doc1_pos[1], target[1], self.speed)
-        self.doc2_pos[0] = self.move_towards(self.doc2_pos[0], target[0], self.speed)
-        self.doc2_pos[1] = self.move_towards(self.doc2_pos[1], target[1], self.speed)
+    # ---------------- Timeline ----------------
+
+    def build_timeline(self):
+        target = self.doc_target()
+
+        # Each coordinate moves towards the target by self.speed per frame and stops there
+        tracks = {}
+        arrival = 1
+        for name, start in (("doc1", self.doc1_pos), ("doc2", self.doc2_pos)):
+            for axis in (0, 1):
+                distance = abs(target[axis] - start[axis])
+                tracks[f"{name}_{'xy'[axis]}"] = Track.linear((0, start[axis]),
+                                                             (distance / self.speed, target[axis]))
+
+                # Arrival counts once every coordinate is within 2 px of the target
+                arrival = max(arrival, -(-(distance - 2) // self.speed))
+
+        # Show the message for 2 seconds, then start over
+        tracks["message"] = Track.after(arrival)
+        return Timeline(arrival + 120, tracks, markers={"arrival": arrival})
+
+    # ---------------- Frame Update ----------------
+
+    def draw_frame(self, surface, state):
+        _, _, printer_img, doc_img = self.scale_elements()
 
         # Draw docs
-        surface.blit(doc_img, self.doc1_pos)
-        surface.blit(doc_img, self.doc2_pos)
-
-        # Arrival check
-        if (abs(self.doc1_pos[0] - target[0]) <= 2 and abs(self.doc1_pos[1] - target[1]) <= 2 and
-                abs(self.doc2_pos[0] - target[0]) <= 2 and abs(self.doc2_pos[1] - target[1]) <= 2):
-            # Pause animation and show a message
-            self.paused = True
-            self.timer.stop()
+        surface.blit(doc_img, (round(state["doc1_x"]), round(state["doc1_y"])))
+        surface.blit(doc_img, (round(state["doc2_x"]), round(state["doc2_y"])))
+
+        if state["message"]:
             self.draw_message(
                 surface,
                 "Both docs sent to the same printer (Singleton)",
                 (0, 255, 0),
                 (self.printer_pos[0], self.printer_pos[1], printer_img.get_width(), printer_img.get_height())
             )
-            QTimer.singleShot(2000, self.resume)
-
-        # Finalize frame
-        self.finalize_frame(surface)
-
-    def resume(self):
-        """Restart animation after a pause."""
-        self.reset_positions()
-        self.paused = False
-        self.timer.start(1000 // 60)
@@ -0,0 +1,104 @@
+from collections import OrderedDict
+
+from PySide6.QtCore import QRect
+
+
+class CachedFrame:
+    """
+    A rendered frame kept as the parts that differ from the static layer.
+
+    Outside its dirty rectangles a frame is the static layer, so the crops
+    under those rectangles are all that is needed to rebuild it.
+    """
+
+    def __init__(self, ops, dirty_rects, crops):
+        # Same attributes as a RenderTarget, so it can be compared and presented like one
+        self.ops = ops
+        self.dirty_rects = dirty_rects
+        self.crops = crops
+        self.nbytes = sum(crop.sizeInBytes() for _, crop in crops)
+
+
+class FrameCache:
+    """
+    LRU cache of the frames of one animation loop under a memory budget.
+
+    Animations are deterministic, so the frame at a given time on the timeline
+    is the same every cycle. Frames are stored by their draw calls and looked
+    up by time; times that draw the same thing share one stored frame.
+    Everything is dropped when the static layer is rebuilt (e.g. on resize).
+    """
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.frames = OrderedDict()
+        self.times = {}
+        self.nbytes = 0
+
+        # Counters for the frame profile
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, t):
+        """Return the cached frame at time t, or None."""
+        key = self.times.get(t)
+        frame = self.frames.get(key) if key is not None else None
+        if frame is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.frames.move_to_end(key)
+        return frame
+
+    def store(self, t, surface, image):
+        """Keep the frame just rendered into surface (whose pixels image shares) as time t."""
+        key = tuple(surface.ops)
+        self.times[t] = key
+        if key in self.frames:
+            self.frames.move_to_end(key)
+            return
+
+        crops = []
+        for rect in {tuple(rect) for rect in surface.dirty_rects if rect.w and rect.h}:
+            crops.append((rect, image.copy(QRect(*rect))))
+        frame = CachedFrame(surface.ops, list(surface.dirty_rects), crops)
+        if frame.nbytes > self.budget:
+            return
+
+        self.frames[key] = frame
+        self.nbytes += frame.nbytes
+        while self.nbytes > self.budget:
+            _, evicted = self.frames.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+            self.evictions += 1
+
+    def alias(self, t, ops):
+        """Record that time t draws the same frame as an already stored one."""
+        key = tuple(ops)
+        if key in self.frames:
+            self.times[t] = key
+
+    def clear(self):
+        """Drop every frame; the counters keep running."""
+        self.frames.clear()
+        self.times.clear()
+        self.nbytes = 0
+        self.invalidations += 1
+
+    def stats(self):
+        """Return hit/miss counters and the memory in use."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "frames": len(self.frames),
+            "times": len(self.times),
+            "bytes": self.nbytes,
+            "budget": self.budget,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
@@ -0,0 +1,107 @@
+import time
+from array import array
+
+from diagnostics.trace import tracer
+
+
+class Ring:
+    """Window of the last size float samples, preallocated so recording one allocates nothing."""
+
+    def __init__(self, size):
+        self.samples = array("d", bytes(8 * size))
+        self.size = size
+        self.count = 0
+        self.next = 0
+
+    def __len__(self):
+        return self.count
+
+    def append(self, value):
+        self.samples[self.next] = value
+        self.next = (self.next + 1) % self.size
+        if self.count < self.size:
+            self.count += 1
+
+    def first(self):
+        return self.samples[self.next if self.count == self.size else 0]
+
+    def last(self):
+        return self.samples[self.next - 1]
+
+    def values(self):
+        """Return the samples in the window, oldest first."""
+        if self.count < self.size:
+            return self.samples[:self.count].tolist()
+        return self.samples[self.next:].tolist() + self.samples[:self.next].tolist()
+
+
+class FrameProfiler:
+    """
+    Rolling timings of an animation's frame pipeline.
+
+    Stages are timed by the code that runs them: take a perf_counter() start
+    and call add(stage, start) when done. The profiler keeps the last WINDOW
+    samples per stage, the times of the last frames presented, and how late
+    the tick timer fired, which is how long the GUI event loop kept it waiting.
+    Stages are also recorded as trace spans while tracing is on.
+    """
+
+    WINDOW = 120
+
+    # Display order; stages not listed here follow in the order first seen
+    STAGES = ("layout", "surface", "evaluate", "draw", "text", "scale",
+              "clear", "blit", "replay", "convert", "present")
+
+    def __init__(self):
+        self.stages = {}
+        self.presents = Ring(self.WINDOW)
+        self.latency = Ring(self.WINDOW)
+        self.ticks = 0
+        self.dropped_ticks = 0
+
+    def add(self, stage, start):
+        """Account for one run of a stage that began at perf_counter() time start."""
+        samples = self.stages.get(stage)
+        if samples is None:
+            samples = self.stages[stage] = Ring(self.WINDOW)
+        samples.append((time.perf_counter() - start) * 1000)
+        tracer.complete(stage, "frame", start)
+
+    def record_present(self):
+        """Count a frame that reached the screen, for the frame rate."""
+        self.presents.append(time.perf_counter())
+
+    def record_tick(self, elapsed, interval):
+        """Account for a tick that came elapsed seconds after the previous one, instead of interval."""
+        self.ticks += 1
+        self.latency.append(max(elapsed - interval, 0.0) * 1000)
+        if elapsed > 1.5 * interval:
+            # The ticks that should have fired in between never did
+            self.dropped_ticks += round(elapsed / interval) - 1
+
+    def fps(self):
+        """Return presented frames per second over the window (0 when idle, e.g. held)."""
+        presents = self.presents
+        if len(presents) < 2 or time.perf_counter() - presents.last() > 1.0:
+            return 0.0
+        return (len(presents) - 1) / (presents.last() - presents.first())
+
+    def stats(self):
+        """Return the frame rate, tick counters, loop latency and per-stage ms (mean and max)."""
+        order = [stage for stage in self.STAGES if stage in self.stages]
+        order += [stage for stage in self.stages if stage not in self.STAGES]
+        return {
+            "fps": self.fps(),
+            "ticks": self.ticks,
+            "dropped_ticks": self.dropped_ticks,
+            "latency_ms": summary(self.latency),
+            "stages": {stage: summary(self.stages[stage]) for stage in order},
+        }
+
+
+def summary(ring):
+    """Return the mean and max of a window of samples."""
+    samples = ring.values()
+    if not samples:
+        return {"mean": 0.0, "max": 0.0}
+    return {"mean": sum(samples) / len(samples), "max": max(samples)}
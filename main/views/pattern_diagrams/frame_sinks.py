@@ -0,0 +1,188 @@
+import time
+
+from PySide6.QtCore import QRectF
+from PySide6.QtGui import QPixmap
+from PySide6.QtWidgets import QGraphicsItem, QGraphicsPixmapItem
+
+
+class FrameSink:
+    """
+    Destination for the frames produced by RasterBackend.
+
+    Sinks receive a QImage of the whole frame plus the rectangles that changed
+    (None for everything) and decide how it reaches the screen. They also
+    time their own painting so the sinks can be compared.
+    """
+
+    def __init__(self, view):
+        self.view = view
+
+        # Counters for the frame profile
+        self.presents = 0
+        self.paints = 0
+        self.paint_seconds = 0.0
+
+    def resize(self, w, h):
+        """Match the sink to a new viewport size."""
+
+    def present(self, image, rects=None):
+        """Show a new frame, repainting only the given rectangles (everything if None)."""
+        raise NotImplementedError
+
+    def dispose(self):
+        """Detach from the view; the sink is not used again."""
+
+    def record_paint(self, start):
+        """Account for one paint that began at perf_counter() time start."""
+        self.paints += 1
+        self.paint_seconds += time.perf_counter() - start
+
+    def stats(self):
+        """Return present/paint counters and the mean paint time."""
+        return {
+            "presents": self.presents,
+            "paints": self.paints,
+            "paint_ms": self.paint_seconds / self.paints * 1000 if self.paints else 0.0,
+        }
+
+
+# ---------------- Direct-paint item ----------------
+
+class FrameItem(QGraphicsItem):
+    """Scene item that paints presented frames straight from their QImage."""
+
+    def __init__(self, sink):
+        super().__init__()
+        self.sink = sink
+        self.image = None
+        self.rect = QRectF()
+
+        # Only the exposed part of the frame is painted
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption)
+
+    def boundingRect(self):
+        return self.rect
+
+    def resize(self, w, h):
+        self.prepareGeometryChange()
+        self.rect = QRectF(0, 0, w, h)
+
+    def paint(self, painter, option, widget=None):
+        if self.image is None:
+            return
+
+        start = time.perf_counter()
+        rect = option.exposedRect
+        painter.drawImage(rect, self.image, rect)
+        self.sink.record_paint(start)
+
+
+class ItemSink(FrameSink):
+    """Paints each frame from its buffer through a FrameItem, repainting only dirty rectangles."""
+
+    def __init__(self, view):
+        super().__init__(view)
+        self.item = FrameItem(self)
+        view.scene.addItem(self.item)
+
+    def resize(self, w, h):
+        self.item.resize(w, h)
+
+    def present(self, image, rects=None):
+        self.presents += 1
+        self.item.image = image
+        if rects is None:
+            self.item.update()
+            return
+
+        for x, y, w, h in rects:
+            self.item.update(QRectF(x, y, w, h))
+
+    def dispose(self):
+        self.item.image = None
+        self.view.scene.removeItem(self.item)
+
+
+# ---------------- Pixmap item ----------------
+
+class FramePixmapItem(QGraphicsPixmapItem):
+    """QGraphicsPixmapItem that reports its paint time to the sink."""
+
+    def __init__(self, sink):
+        super().__init__()
+        self.sink = sink
+
+    def paint(self, painter, option, widget=None):
+        start = time.perf_counter()
+        super().paint(painter, option, widget)
+        self.sink.record_paint(start)
+
+
+class PixmapSink(FrameSink):
+    """Converts every frame to a QPixmap on a QGraphicsPixmapItem; the whole item repaints."""
+
+    def __init__(self, view):
+        super().__init__(view)
+        self.item = FramePixmapItem(self)
+        view.scene.addItem(self.item)
+
+    def present(self, image, rects=None):
+        self.presents += 1
+        self.item.setPixmap(QPixmap.fromImage(image))
+
+    def dispose(self):
+        self.view.scene.removeItem(self.item)
+
+
+# ---------------- View background ----------------
+
+class BackgroundSink(FrameSink):
+    """Paints frames with QPainter in DiagramView.drawBackground, with no scene item at all."""
+
+    def __init__(self, view):
+        super().__init__(view)
+        self.image = None
+        view.background_sink = self
+
+    def present(self, image, rects=None):
+        self.presents += 1
+        self.image = image
+        if rects is None:
+            self.view.scene.update()
+            return
+
+        for x, y, w, h in rects:
+            self.view.scene.update(QRectF(x, y, w, h))
+
+    def dispose(self):
+        self.image = None
+        if self.view.background_sink is self:
+            self.view.background_sink = None
+
+    def paint(self, painter, rect):
+        """Draw the part of the frame inside rect (scene coordinates)."""
+        if self.image is None:
+            return
+
+        start = time.perf_counter()
+        rect = rect.intersected(QRectF(self.image.rect()))
+        painter.drawImage(rect, self.image, rect)
+        self.record_paint(start)
+
+
+# ---------------- Headless ----------------
+
+class NullSink(FrameSink):
+    """Drops frames; for headless runs and for timing rendering alone."""
+
+    def present(self, image, rects=None):
+        self.presents += 1
+
+
+# Sinks selectable through DiagramView.frame_sink
+FRAME_SINKS = {
+    "item": ItemSink,
+    "pixmap": PixmapSink,
+    "background": BackgroundSink,
+    "null": NullSink,
+}
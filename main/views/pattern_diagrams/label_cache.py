@@ -0,0 +1,39 @@
+from collections import OrderedDict
+
+
+class LabelCache:
+    """Bounded LRU cache of rendered text labels shared by all animations."""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.labels = OrderedDict()
+
+        # Counters for the frame profile
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, font_key, text, color):
+        """Return the rendered label, rasterising it only on a cache miss."""
+        key = (text, tuple(color), font_key)
+        label = self.labels.get(key)
+        if label is not None:
+            self.hits += 1
+            self.labels.move_to_end(key)
+            return label
+
+        self.misses += 1
+        label = font.render(text, True, color)
+        self.labels[key] = label
+        if len(self.labels) > self.maxsize:
+            self.labels.popitem(last=False)
+        return label
+
+    def stats(self):
+        """Return hit/miss counters and the current cache size."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self.labels),
+        }
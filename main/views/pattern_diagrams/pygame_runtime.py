@@ -0,0 +1,88 @@
+import json
+import os
+
+import pygame
+
+from assets.files import cache_dir
+from diagnostics.trace import tracer
+
+
+class FontPathCache:
+    """
+    Resolved font files, remembered across runs in a small JSON file.
+
+    Resolving a font by name makes pygame scan the system fonts (fc-list on
+    Linux), which is slow; the result only changes when fonts are installed
+    or removed. A remembered file that no longer exists is resolved again,
+    and a font that was not found is not remembered, so installing it later
+    takes effect on the next run.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        try:
+            with open(path) as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def resolve(self, name, bold):
+        """Return (font file or None for pygame's default font, whether bold must be synthesised)."""
+        key = f"{name}:{'bold' if bold else 'regular'}"
+        entry = self.entries.get(key)
+        if entry is not None and entry["path"] is not None and os.path.exists(entry["path"]):
+            return entry["path"], entry["synthetic_bold"]
+
+        with tracer.span(f"resolve font {key}", "app"):
+            path = pygame.font.match_font(name, bold=bold)
+            # Like SysFont: a bold request answered with the regular face is emboldened
+            synthetic_bold = bold and (path is None or path == pygame.font.match_font(name))
+        if path is None:
+            return path, synthetic_bold
+        self.entries[key] = {"path": path, "synthetic_bold": synthetic_bold}
+        self.save()
+        return path, synthetic_bold
+
+    def save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "w") as f:
+                json.dump(self.entries, f, indent=2, sort_keys=True)
+        except OSError:
+            pass  # Only a cache; resolve again next run
+
+
+class PygameRuntime:
+    """
+    Process-wide pygame state shared by all animations.
+
+    Only the font module is initialised: frames are drawn on plain surfaces
+    and images are loaded without a display, so video, audio and joystick
+    are never started. Fonts are created once per (name, size, bold) and
+    shared by every animation.
+    """
+
+    instance = None
+
+    @classmethod
+    def get(cls):
+        """Return the runtime, initialising pygame on first use."""
+        if cls.instance is None:
+            cls.instance = cls()
+        return cls.instance
+
+    def __init__(self):
+        with tracer.span("pygame.font.init", "app"):
+            pygame.font.init()
+        self.font_paths = FontPathCache(os.path.join(cache_dir(), "fonts.json"))
+        self.fonts = {}
+
+    def font(self, name, size, bold=False):
+        """Return the shared font for (name, size, bold)."""
+        key = (name, size, bold)
+        font = self.fonts.get(key)
+        if font is None:
+            path, synthetic_bold = self.font_paths.resolve(name, bold)
+            font = self.fonts[key] = pygame.font.Font(path, size)
+            font.set_bold(synthetic_bold)
+        return font
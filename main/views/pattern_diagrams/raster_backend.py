@@ -0,0 +1,289 @@
+import ctypes
+import time
+
+import pygame
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QImage, QPainter
+
+from .frame_cache import FrameCache
+from .frame_sinks import FRAME_SINKS
+from .label_cache import LabelCache
+from .pygame_runtime import PygameRuntime
+from .render_target import RenderTarget
+
+
+class RasterBackend:
+    """Rasterises frames with pygame and hands them to a frame sink."""
+
+    # Pixel masks of a 32-bit pygame surface that match Qt's ARGB32 layout
+    ARGB32_MASKS = (0x00FF0000, 0x0000FF00, 0x000000FF, 0xFF000000)
+
+    # Rendered text labels, shared across animation instances
+    labels = LabelCache()
+
+    def __init__(self, animation):
+        self.animation = animation
+        self.view = animation.view
+
+        # Where finished frames go, chosen by DiagramView.frame_sink
+        self.sink = FRAME_SINKS[getattr(self.view, "frame_sink", "item")](self.view)
+
+        # Label font, shared with every other animation through the pygame runtime
+        self.font_key = ("Arial", 24, True)
+        self.font = PygameRuntime.get().font(*self.font_key)
+
+        # Frames are cleared to the viewport colour so every pixel is opaque
+        self.background = self.view_background()
+
+        # Double-buffered render targets as (surface, QImage) pairs
+        self.buffers = []
+        self.back = 0
+
+        # Surface currently shown by the sink (painted from its buffer)
+        self.presented = None
+
+        # Repaint the whole frame on the next present (new targets or layer)
+        self.full_present = True
+
+        # Opaque background layer with everything that never moves
+        self.static_layer = None
+
+        # Optional cache of the loop's frames, sized by DiagramView.frame_cache_mb
+        budget = getattr(self.view, "frame_cache_mb", 0)
+        self.frame_cache = FrameCache(budget * 1024 * 1024) if budget else None
+        self.static_image = None
+
+        # Cached frame that the frame in progress replays instead of rendering
+        self.cached = None
+
+        # Counters for the frame profile
+        self.frames_presented = 0
+        self.frames_elided = 0
+
+    @staticmethod
+    def create_timer():
+        """Frames are driven by a plain QTimer, precise so ticks track the step clock."""
+        timer = QTimer()
+        timer.setTimerType(Qt.PreciseTimer)
+        return timer
+
+    def view_background(self):
+        """Return the viewport background as an opaque RGBA tuple."""
+        viewport = self.view.viewport()
+        color = viewport.palette().color(viewport.backgroundRole())
+        return color.red(), color.green(), color.blue(), 255
+
+    # ---------------- Render targets ----------------
+
+    def resize(self, w, h):
+        """Match the frame sink and the render targets to the viewport size."""
+        self.sink.resize(w, h)
+        if not self.buffers or self.buffers[0][0].get_size() != (w, h):
+            self.allocate_buffers()
+
+    def allocate_buffers(self):
+        """(Re)allocate the front and back render targets at the viewport size."""
+        self.buffers = []
+        for _ in range(2):
+            surface = RenderTarget(self.animation.view_size(), pygame.SRCALPHA)
+            self.buffers.append((surface, self.wrap_surface(surface)))
+        self.back = 0
+        self.full_present = True
+
+    def build_static_layer(self):
+        """Composite the background colour and the static sprites and labels once."""
+        # No per-pixel alpha, so the layer is copied into the targets without blending
+        layer = RenderTarget(self.animation.view_size(), 0, 32)
+        layer.fill(self.background)
+        self.animation.draw_static(layer)
+        layer.render()
+        self.static_layer = layer
+
+        for surface, _ in self.buffers:
+            surface.stale = True
+        self.full_present = True
+
+        # Cached frames were drawn over the old layer
+        if self.frame_cache is not None:
+            self.frame_cache.clear()
+            self.static_image = self.wrap_surface(layer).convertToFormat(QImage.Format_RGB32)
+
+    def begin_frame(self):
+        """Return the back buffer, recording the frame's draw calls."""
+        if not self.buffers:
+            self.allocate_buffers()
+        if self.static_layer is None:
+            self.build_static_layer()
+
+        self.back = 1 - self.back
+        surface = self.buffers[self.back][0]
+        surface.begin()
+        return surface
+
+    # ---------------- Frame handoff ----------------
+
+    @classmethod
+    def wrap_surface(cls, surface):
+        """
+        Return a QImage sharing the surface's pixel buffer.
+
+        Frames are fully opaque, so the ARGB32 buffer is already in Qt's native
+        RGB32 layout (0xffRRGGBB) and can be painted without a conversion.
+        Surfaces with another pixel layout fall back to a converted copy.
+        """
+        w, h = surface.get_size()
+        if surface.get_bitsize() != 32 or surface.get_masks() != cls.ARGB32_MASKS:
+            data = pygame.image.tostring(surface, "RGBA")
+            return QImage(data, w, h, QImage.Format_RGBA8888)
+
+        pitch = surface.get_pitch()
+        pixels = (ctypes.c_ubyte * (pitch * h)).from_address(cls.pixels_address(surface))
+        image = QImage(pixels, w, h, pitch, QImage.Format_RGB32)
+        # Keep the ctypes view alive as long as the image refers to it
+        image.pixels = pixels
+        return image
+
+    @staticmethod
+    def pixels_address(surface):
+        """
+        Return the address of the surface's pixels, for a view that outlives the frame.
+
+        The public get_buffer()/get_view() would do, but a surface stays locked
+        while any buffer view of it exists, and a locked surface cannot be
+        blitted to; the render targets are wrapped once and drawn into every
+        frame. So the private _pixels_address is used, checked against a
+        short-lived public view so that a pygame release changing it fails here.
+        """
+        address = getattr(surface, "_pixels_address", None)
+        view = surface.get_view("2")
+        expected = view.__array_interface__["data"][0]
+        del view  # Unlocks the surface again
+        if address != expected:
+            raise RuntimeError(f"pygame {pygame.version.ver}: Surface._pixels_address is "
+                               f"{address!r}, not the pixel buffer at {expected:#x}")
+        return address
+
+    def to_qimage(self, surface):
+        """Return the QImage view of a surface, reusing the render targets' wrappers."""
+        for buffer, image in self.buffers:
+            if buffer is surface:
+                return image
+        return self.wrap_surface(surface)
+
+    def end_frame(self, surface, t=None):
+        """Rasterise and present the frame at time t, unless it repeats the one on screen."""
+        cached, self.cached = self.cached, None
+        if not self.full_present and self.presented is not None and surface.ops == self.presented.ops:
+            # Same draw calls, same pixels: keep drawing into this back buffer next time
+            self.back = 1 - self.back
+            self.frames_elided += 1
+            if self.frame_cache is not None and t is not None and cached is None:
+                self.frame_cache.alias(t, self.presented.ops)
+            return
+
+        profiler = self.animation.profiler
+        if cached is not None:
+            start = time.perf_counter()
+            self.replay(surface, cached)
+            profiler.add("replay", start)
+        else:
+            # Restore the static layer where this buffer last drew, then draw the frame
+            start = time.perf_counter()
+            surface.restore(self.static_layer)
+            profiler.add("clear", start)
+
+            start = time.perf_counter()
+            surface.render()
+            profiler.add("blit", start)
+            if self.frame_cache is not None and t is not None:
+                self.frame_cache.store(t, surface, self.to_qimage(surface))
+
+        if self.full_present or self.presented is None:
+            rects = None
+            self.full_present = False
+        else:
+            # Pixels differ where this frame or the one on screen drew
+            rects = surface.dirty_rects + self.presented.dirty_rects
+
+        start = time.perf_counter()
+        image = self.to_qimage(surface)
+        profiler.add("convert", start)
+
+        start = time.perf_counter()
+        self.sink.present(image, rects)
+        profiler.add("present", start)
+        profiler.record_present()
+
+        # The sink paints from the surface's buffer, so keep the surface alive
+        # while it is on screen, even after a resize reallocates the targets
+        self.presented = surface
+        self.frames_presented += 1
+
+    def dispose(self):
+        """Take the sink off the view and drop the render targets and cached frames."""
+        self.sink.dispose()
+        self.buffers = []
+        self.presented = None
+        self.static_layer = None
+        self.static_image = None
+        self.cached = None
+        if self.frame_cache is not None:
+            self.frame_cache.clear()
+
+    def stats(self):
+        """Return presented/elided frame counters, the sink's, the label cache's, and the frame cache's if enabled."""
+        frames = self.frames_presented + self.frames_elided
+        stats = {
+            "presented": self.frames_presented,
+            "elided": self.frames_elided,
+            "elided_rate": self.frames_elided / frames if frames else 0.0,
+            "sink": self.sink.stats(),
+            "labels": self.labels.stats(),
+        }
+        if self.frame_cache is not None:
+            stats["frame_cache"] = self.frame_cache.stats()
+        return stats
+
+    # ---------------- Frame cache ----------------
+
+    def draw_cached(self, surface, t):
+        """Set up the frame to replay time t from the frame cache; return False on a miss."""
+        if self.frame_cache is None:
+            return False
+
+        cached = self.frame_cache.get(t)
+        if cached is None:
+            return False
+
+        # The draw calls still identify the frame for elision
+        surface.ops = cached.ops
+        self.cached = cached
+        return True
+
+    def replay(self, surface, cached):
+        """Rebuild a cached frame in the surface's buffer with QPainter, leaving pygame idle."""
+        image = self.to_qimage(surface)
+        painter = QPainter(image)
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+
+        # Same restore as RenderTarget.restore, then the crops over it
+        if surface.stale:
+            painter.drawImage(0, 0, self.static_image)
+            surface.stale = False
+        else:
+            for x, y, w, h in surface.dirty_rects:
+                painter.drawImage(x, y, self.static_image, x, y, w, h)
+        for (x, y, _, _), crop in cached.crops:
+            painter.drawImage(x, y, crop)
+        painter.end()
+
+        surface.dirty_rects = list(cached.dirty_rects)
+
+    # ---------------- Text ----------------
+
+    def render_text(self, text, color):
+        """Return a rendered text label from the shared label cache."""
+        start = time.perf_counter()
+        label = self.labels.render(self.font, self.font_key, text, color)
+        self.animation.profiler.add("text", start)
+        return label
@@ -0,0 +1,59 @@
+import pygame
+
+
+class RenderTarget(pygame.Surface):
+    """
+    Surface that records a frame's draw calls and rasterises them on render().
+
+    The recorded calls fingerprint the frame: sprites and labels come from
+    caches and are never modified, so two frames with equal calls have equal
+    pixels and the second one does not need to be drawn or presented.
+    """
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.ops = []
+        self.dirty_rects = []
+
+        # Content is unknown (new or invalidated), restore all of it next time
+        self.stale = True
+
+    def begin(self):
+        """Start recording a new frame."""
+        self.ops = []
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        self.ops.append(("blit", source, tuple(dest), area and tuple(area), special_flags))
+        size = (area[2], area[3]) if area else source.get_size()
+        return pygame.Rect((dest[0], dest[1]), size)
+
+    def draw_line(self, color, start, end, width=1):
+        self.ops.append(("line", tuple(color), tuple(start), tuple(end), width))
+
+    def draw_polygon(self, color, points):
+        self.ops.append(("polygon", tuple(color), tuple(tuple(point) for point in points)))
+
+    def render(self):
+        """Rasterise the recorded calls, remembering the rectangles they touched."""
+        for op in self.ops:
+            kind = op[0]
+            if kind == "blit":
+                _, source, dest, area, special_flags = op
+                rect = pygame.Surface.blit(self, source, dest, area, special_flags)
+            elif kind == "line":
+                _, color, start, end, width = op
+                rect = pygame.draw.line(self, color, start, end, width)
+            else:
+                _, color, points = op
+                rect = pygame.draw.polygon(self, color, points)
+            self.dirty_rects.append(rect)
+
+    def restore(self, layer):
+        """Copy the layer back over everything drawn since the last restore."""
+        if self.stale:
+            pygame.Surface.blit(self, layer, (0, 0))
+            self.stale = False
+        else:
+            for rect in self.dirty_rects:
+                pygame.Surface.blit(self, layer, rect, rect)
+        self.dirty_rects = []
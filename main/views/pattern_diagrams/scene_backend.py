@@ -0,0 +1,237 @@
+import time
+
+import pygame
+from PySide6.QtCore import QAbstractAnimation, QLineF, QPointF, Qt, Signal
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QImage, QPen, QPixmap, QPolygonF
+from PySide6.QtWidgets import (
+    QGraphicsLineItem, QGraphicsPixmapItem, QGraphicsPolygonItem, QGraphicsSimpleTextItem
+)
+
+
+class AnimationClock(QAbstractAnimation):
+    """
+    Endless animation that emits timeout on every tick of Qt's animation timer.
+
+    It provides the parts of QTimer the animations use (timeout, start, stop,
+    isActive), so animations drive either backend the same way.
+    """
+
+    timeout = Signal()
+
+    def duration(self):
+        return -1
+
+    def updateCurrentTime(self, current_time):
+        # start() rewinds to 0 synchronously; only real ticks advance a frame
+        if current_time > 0:
+            self.timeout.emit()
+
+    def start(self, interval=None):
+        """Start ticking; the tick rate belongs to Qt's animation timer, not the caller."""
+        super().start()
+
+    def isActive(self):
+        return self.state() == QAbstractAnimation.Running
+
+
+class SceneText:
+    """Text label measured with Qt font metrics and drawn as a scene text item."""
+
+    def __init__(self, text, color, font, metrics):
+        self.text = text
+        self.color = color
+        self.font = font
+        self.size = (metrics.horizontalAdvance(text), metrics.height())
+
+    def get_width(self):
+        return self.size[0]
+
+    def get_height(self):
+        return self.size[1]
+
+    def get_size(self):
+        return self.size
+
+
+class SceneCanvas:
+    """
+    Stand-in for a render target that maps draw calls onto reused scene items.
+
+    Items are handed out per kind in draw order, so a frame that repeats the
+    previous one only moves or restyles the items whose parameters changed and
+    Qt repaints just those.
+    """
+
+    KINDS = (QGraphicsPixmapItem, QGraphicsSimpleTextItem, QGraphicsLineItem, QGraphicsPolygonItem)
+
+    def __init__(self, backend, z_base):
+        self.backend = backend
+        self.scene = backend.view.scene
+        self.z_base = z_base
+        self.pools = {kind: [] for kind in self.KINDS}
+        self.used = dict.fromkeys(self.KINDS, 0)
+        self.order = 0
+
+    def begin(self):
+        """Start a frame: every pooled item is free again."""
+        self.order = 0
+        for kind in self.KINDS:
+            self.used[kind] = 0
+
+    def end(self):
+        """Finish a frame: hide the items this frame did not use."""
+        for kind, pool in self.pools.items():
+            for item in pool[self.used[kind]:]:
+                item.setVisible(False)
+
+    def dispose(self):
+        """Remove every pooled item from the scene."""
+        for pool in self.pools.values():
+            for item in pool:
+                self.scene.removeItem(item)
+            pool.clear()
+
+    def next_item(self, kind):
+        """Return the next free item of a kind, stacked above the previous draw call."""
+        pool = self.pools[kind]
+        index = self.used[kind]
+        if index == len(pool):
+            item = kind()
+            item.key = None
+            self.scene.addItem(item)
+            pool.append(item)
+
+        item = pool[index]
+        self.used[kind] = index + 1
+        item.setZValue(self.z_base + self.order)
+        item.setVisible(True)
+        self.order += 1
+        return item
+
+    # ---------------- Render target interface ----------------
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        x, y = int(dest[0]), int(dest[1])
+
+        if isinstance(source, SceneText):
+            item = self.next_item(QGraphicsSimpleTextItem)
+            key = (source.text, source.color)
+            if item.key != key:
+                item.setText(source.text)
+                item.setFont(source.font)
+                item.setBrush(QColor(*source.color))
+                item.key = key
+        else:
+            item = self.next_item(QGraphicsPixmapItem)
+            if item.key is not source:
+                item.setPixmap(self.backend.pixmap(source))
+                item.key = source
+
+        item.setPos(x, y)
+        return pygame.Rect((x, y), source.get_size())
+
+    def draw_line(self, color, start, end, width=1):
+        item = self.next_item(QGraphicsLineItem)
+        key = (tuple(color), width)
+        if item.key != key:
+            pen = QPen(QColor(*color), width)
+            pen.setCapStyle(Qt.FlatCap)
+            item.setPen(pen)
+            item.key = key
+        item.setLine(QLineF(QPointF(*start), QPointF(*end)))
+
+    def draw_polygon(self, color, points):
+        item = self.next_item(QGraphicsPolygonItem)
+        if item.key != tuple(color):
+            item.setPen(Qt.NoPen)
+            item.setBrush(QColor(*color))
+            item.key = tuple(color)
+        item.setPolygon(QPolygonF([QPointF(*point) for point in points]))
+
+
+class SceneBackend:
+    """Builds each frame from reused QGraphicsItems instead of rasterising it with pygame."""
+
+    def __init__(self, animation):
+        self.animation = animation
+        self.view = animation.view
+
+        # Same face and pixel size as the pygame font used by the raster backend
+        self.font = QFont("Arial")
+        self.font.setPixelSize(24)
+        self.font.setBold(True)
+        self.metrics = QFontMetrics(self.font)
+        self.texts = {}
+
+        # Pixmaps of scaled pygame sprites, dropped with the sprites on resize
+        self.pixmaps = {}
+
+        # Static items sit below everything drawn per frame
+        self.static_canvas = SceneCanvas(self, z_base=0)
+        self.canvas = SceneCanvas(self, z_base=10_000)
+        self.static_built = False
+
+    @staticmethod
+    def create_timer():
+        """Frames are driven by Qt's animation timer."""
+        return AnimationClock()
+
+    def resize(self, w, h):
+        self.pixmaps.clear()
+
+    def build_static_layer(self):
+        """Lay out the static sprites and labels as persistent items."""
+        self.static_canvas.begin()
+        self.animation.draw_static(self.static_canvas)
+        self.static_canvas.end()
+        self.static_built = True
+
+    def begin_frame(self):
+        if not self.static_built:
+            self.build_static_layer()
+        self.canvas.begin()
+        return self.canvas
+
+    def draw_cached(self, canvas, t):
+        """Scene items are retained by Qt already, so frames are never cached."""
+        return False
+
+    def end_frame(self, canvas, t=None):
+        # Items were updated by the draw calls already; hiding the unused ones completes the frame
+        start = time.perf_counter()
+        canvas.end()
+        self.animation.profiler.add("present", start)
+        self.animation.profiler.record_present()
+
+    def stats(self):
+        """Return how many scene items and converted pixmaps the backend holds."""
+        return {
+            "items": sum(len(pool) for canvas in (self.static_canvas, self.canvas)
+                         for pool in canvas.pools.values()),
+            "pixmaps": len(self.pixmaps),
+        }
+
+    def dispose(self):
+        """Remove the frame and static items from the scene and drop the converted pixmaps."""
+        self.static_canvas.dispose()
+        self.canvas.dispose()
+        self.pixmaps.clear()
+        self.texts.clear()
+
+    def render_text(self, text, color):
+        key = (text, tuple(color))
+        label = self.texts.get(key)
+        if label is None:
+            label = SceneText(text, tuple(color), self.font, self.metrics)
+            self.texts[key] = label
+        return label
+
+    def pixmap(self, surface):
+        """Return a QPixmap of a pygame sprite, converted once per sprite."""
+        pixmap = self.pixmaps.get(surface)
+        if pixmap is None:
+            w, h = surface.get_size()
+            image = QImage(pygame.image.tostring(surface, "RGBA"), w, h, QImage.Format_RGBA8888)
+            pixmap = QPixmap.fromImage(image)
+            self.pixmaps[surface] = pixmap
+        return pixmap
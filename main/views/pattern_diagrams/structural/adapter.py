@@ -1,6 +1,5 @@
-import os
-import pygame
 from ..PatternAnimation import PatternAnimation
+from ..timeline import Timeline, Track
 
 class AdapterAnimation(PatternAnimation):
     """Adapter pattern animation: US plug -> Adapter -> EU socket."""
@@ -9,15 +8,12 @@ class AdapterAnimation(PatternAnimation):
         super().__init__(view)
 
         # Load resources
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        base_path = os.path.join(
-            current_dir, "../../../../main/resources/diagrams/structural_patterns/adapter/"
-        )
+        base_path = "structural_patterns/adapter"
 
         self.imgs = {
-            "adapter": pygame.image.load(os.path.join(base_path, "adapter.png")),
-            "socket": pygame.image.load(os.path.join(base_path, "eu_socket.png")),
-            "plug": pygame.image.load(os.path.join(base_path, "us_plug.png")),
+            "adapter": self.load_image(base_path, "adapter.png"),
+            "socket": self.load_image(base_path, "eu_socket.png"),
+            "plug": self.load_image(base_path, "us_plug.png"),
         }
 
         self.reset_positions()
@@ -26,7 +22,7 @@ class AdapterAnimation(PatternAnimation):
 
     def reset_positions(self):
         """Initial positions for plug, adapter, and socket."""
-        w, h = self.view.width(), self.view.height()
+        w, h = self.view_size()
 
         self.us_pos = (int(w * 0.15), int(h * 0.5 - 50))
         self.adapter_pos = (int(w * 0.45), int(h * 0.5 - 60))
@@ -39,72 +35,60 @@ class AdapterAnimation(PatternAnimation):
         socket = self.scale_image(self.imgs["socket"], 140, 120)
         return plug, adapter, socket
 
-    # ---------------- Frame Update ----------------
+    def draw_static(self, surface):
+        """The socket and its label never move."""
+        socket_img = self.scale_elements()[2]
+        surface.blit(socket_img, self.eu_pos)
+        self.draw_labels(surface, {"EU Socket": (self.eu_pos[0], self.eu_pos[1] - 30)})
+
+    # ---------------- Timeline ----------------
+
+    def build_timeline(self):
+        plug_img, adapter_img, _ = self.scale_elements()
+        adapter_end = self.eu_pos[0] - adapter_img.get_width() + 30
+
+        # Phase 0 (0-200): US plug directly into EU socket -> fails
+        # Phase 1 (201-401): Plug goes into Adapter -> Adapter into EU socket
+        success = 201
+        plug_start = success + 40
+        return Timeline(2 * success, {
+            "phase": Track.step((0, 0), (success, 1)),
+            # Slides at 4 px per frame for 60 frames, then snaps into the socket / adapter
+            "plug_x": Track.linear(
+                (0, self.us_pos[0]), (60, self.us_pos[0] + 240),
+                (60, self.eu_pos[0] - plug_img.get_width() + 15), (success, self.eu_pos[0] - plug_img.get_width() + 15),
+                (success, self.us_pos[0]), (plug_start, self.us_pos[0]), (plug_start + 60, self.us_pos[0] + 240),
+                (plug_start + 60, adapter_end - plug_img.get_width() + 15),
+            ),
+            "plug": Track.step((0, True), (success, False), (plug_start + 1, True)),
+            # Slides at 3 px per frame for 40 frames, then snaps into the socket
+            "adapter_x": Track.linear(
+                (success, self.adapter_pos[0]), (success + 40, self.adapter_pos[0] + 120),
+                (success + 40, adapter_end),
+            ),
+            "message": Track.step((0, None), (101, "fail"), (success, None), (success + 121, "success")),
+        }, markers={"fail": 0, "success": success})
 
-    def update_frame(self):
-        if self.paused:
-            return
+    # ---------------- Frame Update ----------------
 
-        surface = self.create_surface()
+    def draw_frame(self, surface, state):
         plug_img, adapter_img, socket_img = self.scale_elements()
+        labels = {}
 
-        # Always draw socket
-        surface.blit(socket_img, self.eu_pos)
+        if state["phase"] == 1:
+            adapter_pos = (round(state["adapter_x"]), self.adapter_pos[1])
+            surface.blit(adapter_img, adapter_pos)
+            labels["Adapter"] = (adapter_pos[0], adapter_pos[1] - 30)
 
-        if self.phase == 0:
-            # Phase 0: US plug directly into EU socket -> fails
-            plug_pos = self.move_linear(
-                self.us_pos, self.frame_count,
-                speed=4, max_frames=60,
-                final_offset=(self.eu_pos[0] - self.us_pos[0] - plug_img.get_width() + 15, 0),
-            )
+        if state["plug"]:
+            plug_pos = (round(state["plug_x"]), self.us_pos[1])
             surface.blit(plug_img, plug_pos)
+            labels["US Plug"] = (plug_pos[0], plug_pos[1] - 30)
 
-            self.draw_labels(surface, {
-                "US Plug": (plug_pos[0], plug_pos[1] - 30),
-                "EU Socket": (self.eu_pos[0], self.eu_pos[1] - 30),
-            })
-
-            if self.frame_count > 100:
-                self.draw_message(
-                    surface, "Connection not recognized!", (255, 0, 0),
-                    (*self.eu_pos, socket_img.get_width(), socket_img.get_height())
-                )
-
-        else:
-            # Phase 1: Plug goes into Adapter -> Adapter into EU socket
-            adapter_pos = self.move_linear(
-                self.adapter_pos, self.frame_count,
-                speed=3, max_frames=40,
-                final_offset=(self.eu_pos[0] - self.adapter_pos[0] - adapter_img.get_width() + 30, 0),
-            )
-            surface.blit(adapter_img, adapter_pos)
+        socket_rect = (*self.eu_pos, socket_img.get_width(), socket_img.get_height())
+        if state["message"] == "fail":
+            self.draw_message(surface, "Connection not recognized!", (255, 0, 0), socket_rect)
+        elif state["message"] == "success":
+            self.draw_message(surface, "Power Connected!", (0, 255, 0), socket_rect)
 
-            labels = {
-                "Adapter": (adapter_pos[0], adapter_pos[1] - 30),
-                "EU Socket": (self.eu_pos[0], self.eu_pos[1] - 30),
-            }
-
-            if self.frame_count > 40:
-                plug_pos = self.move_linear(
-                    self.us_pos, self.frame_count - 40,
-                    speed=4, max_frames=60,
-                    final_offset=(adapter_pos[0] - self.us_pos[0] - plug_img.get_width() + 15, 0),
-                                 )
-                surface.blit(plug_img, plug_pos)
-                labels["US Plug"] = (plug_pos[0], plug_pos[1] - 30)
-
-                if self.frame_count > 120:
-                    self.draw_message(
-                        surface, "Power Connected!", (0, 255, 0),
-                        (*self.eu_pos, socket_img.get_width(), socket_img.get_height())
-                    )
-
-            self.draw_labels(surface, labels)
-
-        # Frame & phase control
-        self.frame_count += 1
-        if self.frame_count > 200:
-            self.frame_count, self.phase = 0, 1 - self.phase  # switch fail/success
-
-        self.finalize_frame(surface)
+        self.draw_labels(surface, labels)
@@ -1,6 +1,5 @@
-import os
-import pygame
 from ..PatternAnimation import PatternAnimation
+from ..timeline import Timeline, Track, growth
 
 class BridgeAnimation(PatternAnimation):
     """Bridge pattern animation: decouple Shape from Color."""
@@ -9,26 +8,20 @@ class BridgeAnimation(PatternAnimation):
         super().__init__(view)
 
         # Load resources
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        base_path = os.path.normpath(
-            os.path.join(current_dir, "../../../../main/resources/diagrams/structural_patterns/bridge/")
-        )
-        self.circle_img = pygame.image.load(os.path.join(base_path, "circle.png"))
-        self.square_img = pygame.image.load(os.path.join(base_path, "square.png"))
-        self.blue_paint_img = pygame.image.load(os.path.join(base_path, "blue_paint.png"))
-        self.red_paint_img = pygame.image.load(os.path.join(base_path, "red_paint.png"))
+        base_path = "structural_patterns/bridge"
+        self.circle_img = self.load_image(base_path, "circle.png")
+        self.square_img = self.load_image(base_path, "square.png")
+        self.blue_paint_img = self.load_image(base_path, "blue_paint.png")
+        self.red_paint_img = self.load_image(base_path, "red_paint.png")
 
         # Init state
         self.reset_positions()
-        self.frame_count = 0
-        self.phase = 0
-        self.paused = False
 
     # ---------------- Helpers ----------------
 
     def reset_positions(self):
         """Reset positions of shapes and paints based on the current view size."""
-        w, h = self.view.width(), self.view.height()
+        w, h = self.view_size()
 
         # Shapes at the top
         self.circle_pos = (int(w * 0.25), int(h * 0.2))
@@ -46,42 +39,56 @@ class BridgeAnimation(PatternAnimation):
         red = self.scale_image(self.red_paint_img, 80, 120)
         return circle, square, blue, red
 
-    # ---------------- Frame Update ----------------
-
-    def update_frame(self):
-        if self.paused:
-            return
-
-        surface = self.create_surface()
+    def draw_static(self, surface):
+        """Shapes and paints never move."""
         circle, square, blue, red = self.scale_elements()
-
-        # Draw shapes
         surface.blit(circle, self.circle_pos)
         surface.blit(square, self.square_pos)
-
-        # Draw paints
         surface.blit(blue, self.blue_pos)
         surface.blit(red, self.red_pos)
 
+    def arrows(self, phase):
+        """Return the (start, end) points of the blue and red arrows in a phase."""
+        circle, square, blue, red = self.scale_elements()
+
         # Centers for arrow connections
         circle_center = self.get_center(self.circle_pos, circle)
         square_center = self.get_center(self.square_pos, square)
         blue_center   = self.get_center(self.blue_pos, blue)
         red_center    = self.get_center(self.red_pos, red)
 
-        # Animate arrows
-        self.frame_count += 1
-        progress = self.frame_count * 15
+        if phase == 0:
+            return (blue_center, circle_center), (red_center, square_center)
+        return (blue_center, square_center), (red_center, circle_center)
+
+    # ---------------- Timeline ----------------
+
+    def build_timeline(self):
+        # Colors swap shapes every ~3s; the arrows regrow at each swap
+        swap = 201
+        first_blue, first_red = self.arrows(0)
+        second_blue, second_red = self.arrows(1)
+        return Timeline(2 * swap, {
+            "phase": Track.step((0, 0), (swap, 1)),
+            "blue_arrow": Track.linear(*growth(0, 15, self.arrow_length(*first_blue), swap),
+                                       *growth(swap, 15, self.arrow_length(*second_blue))),
+            "red_arrow": Track.linear(*growth(0, 15, self.arrow_length(*first_red), swap),
+                                      *growth(swap, 15, self.arrow_length(*second_red))),
+        }, markers={"blue_circle": 0, "blue_square": swap})
 
-        if self.phase == 0:
-            self.draw_growing_arrow(surface, blue_center, circle_center, progress, (0, 150, 255))
-            self.draw_growing_arrow(surface, red_center, square_center, progress, (255, 0, 0))
-        else:
-            self.draw_growing_arrow(surface, blue_center, square_center, progress, (0, 150, 255))
-            self.draw_growing_arrow(surface, red_center, circle_center, progress, (255, 0, 0))
+    # ---------------- Frame Update ----------------
+
+    def draw_frame(self, surface, state):
+        circle, square = self.scale_elements()[:2]
+        phase = state["phase"]
+
+        # Animate arrows
+        blue_arrow, red_arrow = self.arrows(phase)
+        self.draw_growing_arrow(surface, *blue_arrow, state["blue_arrow"], (0, 150, 255))
+        self.draw_growing_arrow(surface, *red_arrow, state["red_arrow"], (255, 0, 0))
 
         # Labels
-        if self.phase == 0:
+        if phase == 0:
             labels = {
                 "Circle.paint(Blue)": (self.circle_pos[0], self.circle_pos[1] + circle.get_height() + 10),
                 "Square.paint(Red)": (self.square_pos[0], self.square_pos[1] + square.get_height() + 10),
@@ -92,11 +99,3 @@ class BridgeAnimation(PatternAnimation):
                 "Square.paint(Blue)": (self.square_pos[0], self.square_pos[1] + square.get_height() + 10),
             }
         self.draw_labels(surface, labels)
-
-        # Loop every ~6s
-        if self.frame_count > 200:
-            self.frame_count = 0
-            self.phase = 1 - self.phase
-
-        # Finalize
-        self.finalize_frame(surface)
@@ -1,6 +1,5 @@
-import os
-import pygame
 from ..PatternAnimation import PatternAnimation
+from ..timeline import Timeline, Track, growth
 
 class CompositeAnimation(PatternAnimation):
     """Composite pattern animation drawn directly into the DiagramView."""
@@ -9,25 +8,20 @@ class CompositeAnimation(PatternAnimation):
         super().__init__(view)
 
         # Load resources
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        base_path = os.path.normpath(
-            os.path.join(current_dir, "../../../../main/resources/diagrams/structural_patterns/composite/")
-        )
-        self.package_img = pygame.image.load(os.path.join(base_path, "package.png"))
-        self.headphones_img = pygame.image.load(os.path.join(base_path, "headphones.png"))
-        self.laptop_img = pygame.image.load(os.path.join(base_path, "laptop.png"))
-        self.smartphone_img = pygame.image.load(os.path.join(base_path, "smartphone.png"))
+        base_path = "structural_patterns/composite"
+        self.package_img = self.load_image(base_path, "package.png")
+        self.headphones_img = self.load_image(base_path, "headphones.png")
+        self.laptop_img = self.load_image(base_path, "laptop.png")
+        self.smartphone_img = self.load_image(base_path, "smartphone.png")
 
         # Initialize
         self.reset_positions()
-        self.frame_count = 0
-        self.paused = False
 
     # ---------------- Helpers ----------------
 
     def reset_positions(self):
         """Arrange package at top, items below."""
-        w, h = self.view.width(), self.view.height()
+        w, h = self.view_size()
         sx, sy = self.scale_factor()
 
         # Package at the top center
@@ -45,13 +39,8 @@ class CompositeAnimation(PatternAnimation):
         smartphone = self.scale_image(self.smartphone_img, 100, 120)
         return package, headphones, laptop, smartphone
 
-    # ---------------- Frame Update ----------------
-
-    def update_frame(self):
-        if self.paused:
-            return
-
-        surface = self.create_surface()
+    def draw_static(self, surface):
+        """Package, items and price labels never move."""
         package, headphones, laptop, smartphone = self.scale_elements()
 
         # Draw package
@@ -62,24 +51,10 @@ class CompositeAnimation(PatternAnimation):
         surface.blit(laptop, self.laptop_pos)
         surface.blit(smartphone, self.smartphone_pos)
 
-        # Centers
-        package_center    = self.get_center(self.package_pos, package, "bottom")
-        headphone_center  = self.get_center(self.headphones_pos, headphones, "top")
-        laptop_center     = self.get_center(self.laptop_pos, laptop, "top")
-        smartphone_center = self.get_center(self.smartphone_pos, smartphone, "top")
-
-
-        # Animate arrows downward (Package → Items)
-        self.frame_count += 1
-        progress = self.frame_count * 15
-        self.draw_growing_arrow(surface, package_center, headphone_center, progress)
-        self.draw_growing_arrow(surface, package_center, laptop_center, progress)
-        self.draw_growing_arrow(surface, package_center, smartphone_center, progress)
-
         # Labels
         package_text = ["Order", "2520$"]
         for i, line in enumerate(package_text):
-            label = self.font.render(line, True, (255, 255, 0))
+            label = self.render_text(line, (255, 255, 0))
             surface.blit(label, (self.package_pos[0], self.package_pos[1] - 60 + i * 28))
 
         labels = {
@@ -90,12 +65,33 @@ class CompositeAnimation(PatternAnimation):
 
         for text, pos in labels.items():
             for i, line in enumerate(text.splitlines()):
-                label = self.font.render(line, True, (255, 255, 255))
+                label = self.render_text(line, (255, 255, 255))
                 surface.blit(label, (pos[0], pos[1] + i * 28))
 
-        # Loop
-        if self.frame_count > 200:
-            self.frame_count = 0
+    def arrows(self):
+        """Return the (start, end) points of the package -> item arrows."""
+        package, headphones, laptop, smartphone = self.scale_elements()
+
+        # Centers
+        package_center    = self.get_center(self.package_pos, package, "bottom")
+        headphone_center  = self.get_center(self.headphones_pos, headphones, "top")
+        laptop_center     = self.get_center(self.laptop_pos, laptop, "top")
+        smartphone_center = self.get_center(self.smartphone_pos, smartphone, "top")
+        return [(package_center, headphone_center),
+                (package_center, laptop_center),
+                (package_center, smartphone_center)]
+
+    # ---------------- Timeline ----------------
+
+    def build_timeline(self):
+        length = max(self.arrow_length(*arrow) for arrow in self.arrows())
+        return Timeline(201, {
+            # Animate arrows downward (Package → Items)
+            "arrows": Track.linear(*growth(0, 15, length)),
+        })
+
+    # ---------------- Frame Update ----------------
 
-        # Finalize
-        self.finalize_frame(surface)
+    def draw_frame(self, surface, state):
+        for start, target in self.arrows():
+            self.draw_growing_arrow(surface, start, target, state["arrows"])
@@ -1,6 +1,5 @@
-import os
-import pygame
 from ..PatternAnimation import PatternAnimation
+from ..timeline import Timeline, Track, growth
 
 class DecoratorAnimation(PatternAnimation):
     """Decorator pattern animation drawn directly into DiagramView."""
@@ -9,25 +8,20 @@ class DecoratorAnimation(PatternAnimation):
         super().__init__(view)
 
         # Load resources
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        base_path = os.path.normpath(
-            os.path.join(current_dir, "../../../../main/resources/diagrams/structural_patterns/decorator/")
-        )
-        self.plain_img = pygame.image.load(os.path.join(base_path, "plainIceCream.png"))
-        self.chocolate_img = pygame.image.load(os.path.join(base_path, "chocolate.png"))
-        self.nuts_img = pygame.image.load(os.path.join(base_path, "nuts.png"))
-        self.nutIce_img = pygame.image.load(os.path.join(base_path, "nutIceCream.png"))
-        self.chocoIce_img = pygame.image.load(os.path.join(base_path, "chokoIceCream.png"))
+        base_path = "structural_patterns/decorator"
+        self.plain_img = self.load_image(base_path, "plainIceCream.png")
+        self.chocolate_img = self.load_image(base_path, "chocolate.png")
+        self.nuts_img = self.load_image(base_path, "nuts.png")
+        self.nutIce_img = self.load_image(base_path, "nutIceCream.png")
+        self.chocoIce_img = self.load_image(base_path, "chokoIceCream.png")
 
         # Initialize
         self.reset_positions()
-        self.frame_count = 0
-        self.paused = False
 
     # ---------------- Helpers ----------------
 
     def reset_positions(self):
-        w, h = self.view.width(), self.view.height()
+        w, h = self.view_size()
         sx, sy = self.scale_factor()
 
         # Base plain ice cream in a center
@@ -49,17 +43,16 @@ class DecoratorAnimation(PatternAnimation):
         chocoIce = self.scale_image(self.chocoIce_img, 120, 180)
         return plain, choco, nuts, nutIce, chocoIce
 
-    # ---------------- Frame Update ----------------
-
-    def update_frame(self):
-        if self.paused:
-            return
-
-        surface = self.create_surface()
-        plain, choco, nuts, nutIce, chocoIce = self.scale_elements()
-
-        # Draw plain ice cream
+    def draw_static(self, surface):
+        """Plain ice cream and decorator ingredients never move."""
+        plain, choco, nuts, _, _ = self.scale_elements()
         surface.blit(plain, self.plain_pos)
+        surface.blit(choco, self.choco_pos)
+        surface.blit(nuts, self.nuts_pos)
+
+    def arrows(self):
+        """Return the (start, end) points of the decorator -> ice cream arrows."""
+        plain, choco, nuts, _, _ = self.scale_elements()
 
         # Centers
         plain_center = (self.plain_pos[0] + plain.get_width() // 2,
@@ -68,34 +61,36 @@ class DecoratorAnimation(PatternAnimation):
                         self.choco_pos[1] + choco.get_height() // 2)
         nuts_center = (self.nuts_pos[0] + nuts.get_width() // 2,
                        self.nuts_pos[1] + nuts.get_height() // 2)
+        return {"choco": (choco_center, plain_center), "nuts": (nuts_center, plain_center)}
 
-        # Step through phases
-        self.frame_count += 1
+    # ---------------- Timeline ----------------
+
+    def build_timeline(self):
+        arrows = self.arrows()
         arrow_growth_speed = 15
+        return Timeline(201, {
+            # Phase 1: Chocolate decorator
+            "choco_arrow": Track.linear(*growth(30, arrow_growth_speed, self.arrow_length(*arrows["choco"]))),
+            "choco": Track.after(31),
+            # Phase 2: Nuts decorator
+            "nuts_arrow": Track.linear(*growth(60, arrow_growth_speed, self.arrow_length(*arrows["nuts"]))),
+            "nuts": Track.after(61),
+        }, markers={"chocolate": 31, "nuts": 61})
 
-        # Always show decorator ingredients
-        surface.blit(choco, self.choco_pos)
-        surface.blit(nuts, self.nuts_pos)
+    # ---------------- Frame Update ----------------
 
-        # Phase 1: Chocolate decorator
-        if self.frame_count > 30:
-            progress = (self.frame_count - 30) * arrow_growth_speed
-            self.draw_growing_arrow(surface, choco_center, plain_center, progress)
+    def draw_frame(self, surface, state):
+        nutIce, chocoIce = self.scale_elements()[3:]
+        arrows = self.arrows()
+
+        if state["choco"]:
+            self.draw_growing_arrow(surface, *arrows["choco"], state["choco_arrow"])
             surface.blit(chocoIce, self.chocoIce_pos)
-            lbl = self.font.render("Plain + Chocolate", True, (255, 255, 255))
+            lbl = self.render_text("Plain + Chocolate", (255, 255, 255))
             surface.blit(lbl, (self.chocoIce_pos[0], self.chocoIce_pos[1] - 25))
 
-        # Phase 2: Nuts decorator
-        if self.frame_count > 60:
-            progress = (self.frame_count - 60) * arrow_growth_speed
-            self.draw_growing_arrow(surface, nuts_center, plain_center, progress)
+        if state["nuts"]:
+            self.draw_growing_arrow(surface, *arrows["nuts"], state["nuts_arrow"])
             surface.blit(nutIce, self.nutIce_pos)
-            lbl = self.font.render("Plain + Nuts", True, (255, 255, 255))
+            lbl = self.render_text("Plain + Nuts", (255, 255, 255))
             surface.blit(lbl, (self.nutIce_pos[0], self.nutIce_pos[1] - 25))
-
-        # Loop
-        if self.frame_count > 200:
-            self.frame_count = 0
-
-        # Finalize
-        self.finalize_frame(surface)
@@ -1,6 +1,5 @@
-import os
-import pygame
 from ..PatternAnimation import PatternAnimation
+from ..timeline import Timeline, Track, growth
 
 class FacadeAnimation(PatternAnimation):
     """Facade pattern animation drawn directly into DiagramView."""
@@ -9,25 +8,20 @@ class FacadeAnimation(PatternAnimation):
         super().__init__(view)
 
         # Load resources
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        base_path = os.path.normpath(
-            os.path.join(current_dir, "../../../../main/resources/diagrams/structural_patterns/facade/")
-        )
-        self.traveler_img = pygame.image.load(os.path.join(base_path, "traveler.png"))
-        self.service_img = pygame.image.load(os.path.join(base_path, "travelSservice.png"))
-        self.flight_img = pygame.image.load(os.path.join(base_path, "FlightBooking.png"))
-        self.car_img = pygame.image.load(os.path.join(base_path, "carRental.png"))
-        self.hotel_img = pygame.image.load(os.path.join(base_path, "hotelBooking.png"))
+        base_path = "structural_patterns/facade"
+        self.traveler_img = self.load_image(base_path, "traveler.png")
+        self.service_img = self.load_image(base_path, "travelSservice.png")
+        self.flight_img = self.load_image(base_path, "FlightBooking.png")
+        self.car_img = self.load_image(base_path, "carRental.png")
+        self.hotel_img = self.load_image(base_path, "hotelBooking.png")
 
         # Initialize
         self.reset_positions()
-        self.frame_count = 0
-        self.paused = False
 
     # ---------------- Helpers ----------------
 
     def reset_positions(self):
-        w, h = self.view.width(), self.view.height()
+        w, h = self.view_size()
         sx, sy = self.scale_factor()
 
         # Traveler on the left
@@ -49,13 +43,8 @@ class FacadeAnimation(PatternAnimation):
         hotel = self.scale_image(self.hotel_img, 120, 120)
         return traveler, service, flight, car, hotel
 
-    # ---------------- Frame Update ----------------
-
-    def update_frame(self):
-        if self.paused:
-            return
-
-        surface = self.create_surface()
+    def draw_static(self, surface):
+        """Icons and their labels never move."""
         traveler, service, flight, car, hotel = self.scale_elements()
 
         # Draw base icons
@@ -65,6 +54,22 @@ class FacadeAnimation(PatternAnimation):
         surface.blit(car, self.car_pos)
         surface.blit(hotel, self.hotel_pos)
 
+        # Labels
+        surface.blit(self.render_text("Traveler books trip", (255, 255, 0)),
+                     (self.traveler_pos[0], self.traveler_pos[1] - 30))
+        surface.blit(self.render_text("TravelService", (0, 255, 255)),
+                     (self.service_pos[0], self.service_pos[1] - 40))
+        surface.blit(self.render_text("FlightBooking.book()", (255, 255, 255)),
+                     (self.flight_pos[0], self.flight_pos[1] - 30))
+        surface.blit(self.render_text("CarRental.reserve()", (255, 255, 255)),
+                     (self.car_pos[0], self.car_pos[1] - 30))
+        surface.blit(self.render_text("HotelBooking.book()", (255, 255, 255)),
+                     (self.hotel_pos[0], self.hotel_pos[1] - 30))
+
+    def arrows(self):
+        """Return the (start, end) points of the traveler -> service -> subsystem arrows."""
+        traveler, service, flight, car, hotel = self.scale_elements()
+
         # Centers
         traveler_center = self.get_anchor(self.traveler_pos, traveler, "midright")
         service_center  = self.get_anchor(self.service_pos, service, "midleft")
@@ -72,41 +77,28 @@ class FacadeAnimation(PatternAnimation):
         flight_center   = self.get_anchor(self.flight_pos, flight, "midleft")
         car_center      = self.get_anchor(self.car_pos, car, "midleft")
         hotel_center    = self.get_anchor(self.hotel_pos, hotel, "midleft")
+        return {
+            "service": (traveler_center, service_center),
+            "flight": (service_right, flight_center),
+            "car": (service_right, car_center),
+            "hotel": (service_right, hotel_center),
+        }
 
-        # Animate arrows
-        self.frame_count += 1
-        arrow_growth_speed = 15
+    # ---------------- Timeline ----------------
 
-        # Traveler -> Service
-        self.draw_growing_arrow(surface, traveler_center, service_center,
-                                self.frame_count * arrow_growth_speed)
-
-        # Service -> subsystems
-        if self.frame_count > 30:
-            self.draw_growing_arrow(surface, service_right, flight_center,
-                                    (self.frame_count - 30) * arrow_growth_speed)
-        if self.frame_count > 60:
-            self.draw_growing_arrow(surface, service_right, car_center,
-                                    (self.frame_count - 60) * arrow_growth_speed)
-        if self.frame_count > 90:
-            self.draw_growing_arrow(surface, service_right, hotel_center,
-                                    (self.frame_count - 90) * arrow_growth_speed)
+    def build_timeline(self):
+        arrows = self.arrows()
+        arrow_growth_speed = 15
 
-        # Labels
-        surface.blit(self.font.render("Traveler books trip", True, (255, 255, 0)),
-                     (self.traveler_pos[0], self.traveler_pos[1] - 30))
-        surface.blit(self.font.render("TravelService", True, (0, 255, 255)),
-                     (self.service_pos[0], self.service_pos[1] - 40))
-        surface.blit(self.font.render("FlightBooking.book()", True, (255, 255, 255)),
-                     (self.flight_pos[0], self.flight_pos[1] - 30))
-        surface.blit(self.font.render("CarRental.reserve()", True, (255, 255, 255)),
-                     (self.car_pos[0], self.car_pos[1] - 30))
-        surface.blit(self.font.render("HotelBooking.book()", True, (255, 255, 255)),
-                     (self.hotel_pos[0], self.hotel_pos[1] - 30))
+        # Traveler -> Service, then Service -> each subsystem in turn
+        starts = {"service": 0, "flight": 30, "car": 60, "hotel": 90}
+        return Timeline(201, {
+            name: Track.linear(*growth(start, arrow_growth_speed, self.arrow_length(*arrows[name])))
+            for name, start in starts.items()
+        }, markers=starts)
 
-        # Loop
-        if self.frame_count > 200:
-            self.frame_count = 0
+    # ---------------- Frame Update ----------------
 
-        # Finalize
-        self.finalize_frame(surface)
+    def draw_frame(self, surface, state):
+        for name, (start, target) in self.arrows().items():
+            self.draw_growing_arrow(surface, start, target, state[name])
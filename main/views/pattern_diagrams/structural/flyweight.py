@@ -1,6 +1,5 @@
-import os
-import pygame
 from ..PatternAnimation import PatternAnimation
+from ..timeline import Timeline, Track, growth
 
 class FlyweightAnimation(PatternAnimation):
     """Flyweight pattern animation drawn directly into DiagramView."""
@@ -9,25 +8,20 @@ class FlyweightAnimation(PatternAnimation):
         super().__init__(view)
 
         # Load resources
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        base_path = os.path.normpath(
-            os.path.join(current_dir, "../../../../main/resources/diagrams/structural_patterns/flyweight/")
-        )
-        self.editor_img = pygame.image.load(os.path.join(base_path, "textEditor.png"))
-        self.font_img = pygame.image.load(os.path.join(base_path, "font.png"))
-        self.h_img = pygame.image.load(os.path.join(base_path, "letterH.png"))
-        self.i_img = pygame.image.load(os.path.join(base_path, "letterI.png"))
-        self.ex_img = pygame.image.load(os.path.join(base_path, "exclamation.png"))
+        base_path = "structural_patterns/flyweight"
+        self.editor_img = self.load_image(base_path, "textEditor.png")
+        self.font_img = self.load_image(base_path, "font.png")
+        self.h_img = self.load_image(base_path, "letterH.png")
+        self.i_img = self.load_image(base_path, "letterI.png")
+        self.ex_img = self.load_image(base_path, "exclamation.png")
 
         # Initialize
         self.reset_positions()
-        self.frame_count = 0
-        self.paused = False
 
     # ---------------- Helpers ----------------
 
     def reset_positions(self):
-        w, h = self.view.width(), self.view.height()
+        w, h = self.view_size()
 
         # Editor on top
         self.editor_pos = (int(w * 0.4), int(0.05 * h))
@@ -48,13 +42,8 @@ class FlyweightAnimation(PatternAnimation):
         ex = self.scale_image(self.ex_img, 80, 100)
         return editor, font, h, i, ex
 
-    # ---------------- Frame Update ----------------
-
-    def update_frame(self):
-        if self.paused:
-            return
-
-        surface = self.create_surface()
+    def draw_static(self, surface):
+        """Editor, shared font, letters and their labels never move."""
         editor, font_img, h, i, ex = self.scale_elements()
 
         # Draw base elements
@@ -64,6 +53,22 @@ class FlyweightAnimation(PatternAnimation):
         surface.blit(i, self.i_pos)
         surface.blit(ex, self.ex_pos)
 
+        # Labels (reuse base font)
+        surface.blit(self.render_text("TextEditor", (255, 255, 0)),
+                     (self.editor_pos[0], self.editor_pos[1] - 30))
+        surface.blit(self.render_text("Font (shared)", (255, 255, 255)),
+                     (self.font_pos[0], self.font_pos[1] - 30))
+        surface.blit(self.render_text("Letter H", (255, 255, 255)),
+                     (self.h_pos[0], self.h_pos[1] + h.get_height() + 5))
+        surface.blit(self.render_text("Letter I", (255, 255, 255)),
+                     (self.i_pos[0], self.i_pos[1] + i.get_height() + 5))
+        surface.blit(self.render_text("Letter !", (255, 255, 255)),
+                     (self.ex_pos[0], self.ex_pos[1] + ex.get_height() + 5))
+
+    def arrows(self):
+        """Return the (start, end) points of the editor -> font -> letter arrows."""
+        editor, font_img, h, i, ex = self.scale_elements()
+
         # Centers
         editor_center      = self.get_anchor(self.editor_pos, editor, "bottom")
         font_center_top    = self.get_anchor(self.font_pos, font_img, "top")
@@ -71,45 +76,29 @@ class FlyweightAnimation(PatternAnimation):
         h_center           = self.get_anchor(self.h_pos, h, "top")
         i_center           = self.get_anchor(self.i_pos, i, "top")
         ex_center          = self.get_anchor(self.ex_pos, ex, "top")
+        return {
+            "font": (editor_center, font_center_top),
+            "h": (font_center_bottom, h_center),
+            "i": (font_center_bottom, i_center),
+            "ex": (font_center_bottom, ex_center),
+        }
 
-        # Animate arrows
-        self.frame_count += 1
-        arrow_growth_speed = 15
+    # ---------------- Timeline ----------------
 
-        # Editor → Font
-        self.draw_growing_arrow(surface, editor_center, font_center_top,
-                                self.frame_count * arrow_growth_speed,
-                                color=(255, 255, 0))
-
-        # Font → Letters
-        if self.frame_count > 30:
-            self.draw_growing_arrow(surface, font_center_bottom, h_center,
-                                    (self.frame_count - 30) * arrow_growth_speed,
-                                    color=(0, 255, 255))
-        if self.frame_count > 60:
-            self.draw_growing_arrow(surface, font_center_bottom, i_center,
-                                    (self.frame_count - 60) * arrow_growth_speed,
-                                    color=(0, 255, 255))
-        if self.frame_count > 90:
-            self.draw_growing_arrow(surface, font_center_bottom, ex_center,
-                                    (self.frame_count - 90) * arrow_growth_speed,
-                                    color=(0, 255, 255))
+    def build_timeline(self):
+        arrows = self.arrows()
+        arrow_growth_speed = 15
 
-        # Labels (reuse base font)
-        surface.blit(self.font.render("TextEditor", True, (255, 255, 0)),
-                     (self.editor_pos[0], self.editor_pos[1] - 30))
-        surface.blit(self.font.render("Font (shared)", True, (255, 255, 255)),
-                     (self.font_pos[0], self.font_pos[1] - 30))
-        surface.blit(self.font.render("Letter H", True, (255, 255, 255)),
-                     (self.h_pos[0], self.h_pos[1] + h.get_height() + 5))
-        surface.blit(self.font.render("Letter I", True, (255, 255, 255)),
-                     (self.i_pos[0], self.i_pos[1] + i.get_height() + 5))
-        surface.blit(self.font.render("Letter !", True, (255, 255, 255)),
-                     (self.ex_pos[0], self.ex_pos[1] + ex.get_height() + 5))
+        # Editor → Font, then Font → each letter in turn
+        starts = {"font": 0, "h": 30, "i": 60, "ex": 90}
+        return Timeline(201, {
+            name: Track.linear(*growth(start, arrow_growth_speed, self.arrow_length(*arrows[name])))
+            for name, start in starts.items()
+        }, markers=starts)
 
-        # Loop
-        if self.frame_count > 200:
-            self.frame_count = 0
+    # ---------------- Frame Update ----------------
 
-        # Finalize
-        self.finalize_frame(surface)
+    def draw_frame(self, surface, state):
+        for name, (start, target) in self.arrows().items():
+            color = (255, 255, 0) if name == "font" else (0, 255, 255)
+            self.draw_growing_arrow(surface, start, target, state[name], color=color)
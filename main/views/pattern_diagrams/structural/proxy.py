@@ -1,6 +1,5 @@
-import os
-import pygame
 from ..PatternAnimation import PatternAnimation
+from ..timeline import Timeline, Track, growth
 
 class ProxyAnimation(PatternAnimation):
     """Proxy pattern animation drawn directly into the DiagramView."""
@@ -9,24 +8,18 @@ class ProxyAnimation(PatternAnimation):
         super().__init__(view)
 
         # Load resources
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        base_path = os.path.normpath(
-            os.path.join(current_dir, "../../../../main/resources/diagrams/structural_patterns/proxy/")
-        )
-        self.scientist_img = pygame.image.load(os.path.join(base_path, "dataScientist.png"))
-        self.password_img = pygame.image.load(os.path.join(base_path, "password.png"))
-        self.data_img = pygame.image.load(os.path.join(base_path, "data.png"))
+        base_path = "structural_patterns/proxy"
+        self.scientist_img = self.load_image(base_path, "dataScientist.png")
+        self.password_img = self.load_image(base_path, "password.png")
+        self.data_img = self.load_image(base_path, "data.png")
 
         # Initialize
         self.reset_positions()
-        self.frame_count = 0
-        self.phase = 0   # 0 = no access, 1 = access granted
-        self.paused = False
 
     # ---------------- Helpers ----------------
 
     def reset_positions(self):
-        w, h = self.view.width(), self.view.height()
+        w, h = self.view_size()
 
         # Place icons
         self.scientist_pos = (int(w * 0.05), int(h * 0.4))
@@ -39,58 +32,63 @@ class ProxyAnimation(PatternAnimation):
         data = self.scale_image(self.data_img, 140, 120)
         return scientist, password, data
 
-    # ---------------- Frame Update ----------------
-
-    def update_frame(self):
-        if self.paused:
-            return
-
-        surface = self.create_surface()
+    def draw_static(self, surface):
+        """Scientist, password and data never move."""
         scientist, password, data = self.scale_elements()
-
-        # Draw icons
         surface.blit(scientist, self.scientist_pos)
         surface.blit(password, self.password_pos)
         surface.blit(data, self.data_pos)
 
+    def arrows(self):
+        """Return the (start, end) points of the scientist -> password -> data arrows."""
+        scientist, password, data = self.scale_elements()
+
         # Centers
         scientist_center      = self.get_anchor(self.scientist_pos, scientist, "midright")
         password_center_left  = self.get_anchor(self.password_pos, password, "midleft")
         password_center_right = self.get_anchor(self.password_pos, password, "midright")
         data_center           = self.get_anchor(self.data_pos, data, "midleft")
+        return {
+            "request": (scientist_center, password_center_left),
+            "access": (password_center_right, data_center),
+        }
 
+    # ---------------- Timeline ----------------
 
-        # Animate
-        self.frame_count += 1
+    def build_timeline(self):
+        arrows = self.arrows()
         arrow_speed = 15
+        request = self.arrow_length(*arrows["request"])
+
+        # Phase 0 (0-200): access denied, phase 1 (201-401): access granted
+        granted = 201
+        return Timeline(2 * granted, {
+            "phase": Track.step((0, 0), (granted, 1)),
+            # Scientist → Password, in both phases
+            "request": Track.linear(*growth(0, arrow_speed, request, granted),
+                                    *growth(granted, arrow_speed, request)),
+            # Password → Data
+            "access": Track.linear(*growth(granted + 40, arrow_speed, self.arrow_length(*arrows["access"]))),
+            "message": Track.step((0, False), (81, True), (granted, False), (granted + 101, True)),
+        }, markers={"denied": 0, "granted": granted})
 
-        if self.phase == 0:  # Access denied
-            # Scientist → Password
-            self.draw_growing_arrow(surface, scientist_center, password_center_left,
-                                    self.frame_count * arrow_speed, color=(255, 0, 0))
+    # ---------------- Frame Update ----------------
+
+    def draw_frame(self, surface, state):
+        password, data = self.scale_elements()[1:]
+        arrows = self.arrows()
 
-            if self.frame_count > 80:
+        if state["phase"] == 0:  # Access denied
+            self.draw_growing_arrow(surface, *arrows["request"], state["request"], color=(255, 0, 0))
+
+            if state["message"]:
                 self.draw_message(surface, "Access Denied", (255, 0, 0),
                                   (*self.password_pos, password.get_width(), password.get_height()))
 
         else:  # Access granted
-            # Scientist → Password
-            self.draw_growing_arrow(surface, scientist_center, password_center_left,
-                                    self.frame_count * arrow_speed, color=(0, 255, 0))
+            self.draw_growing_arrow(surface, *arrows["request"], state["request"], color=(0, 255, 0))
+            self.draw_growing_arrow(surface, *arrows["access"], state["access"], color=(0, 255, 0))
 
-            # Password → Data
-            if self.frame_count > 40:
-                self.draw_growing_arrow(surface, password_center_right, data_center,
-                                        (self.frame_count - 40) * arrow_speed, color=(0, 255, 0))
-
-            if self.frame_count > 100:
+            if state["message"]:
                 self.draw_message(surface, "Access Granted", (0, 255, 0),
                                   (*self.data_pos, data.get_width(), data.get_height()))
-
-        # Loop: switch phase
-        if self.frame_count > 200:
-            self.frame_count = 0
-            self.phase = 1 - self.phase
-
-        # Finalize
-        self.finalize_frame(surface)
@@ -0,0 +1,104 @@
+from bisect import bisect_right
+
+
+def lerp(a, b, f):
+    """Interpolate numbers or tuples of numbers."""
+    if isinstance(a, tuple):
+        return tuple(x + (y - x) * f for x, y in zip(a, b))
+    return a + (b - a) * f
+
+
+def growth(start, speed, length, end=None):
+    """
+    Keyframes for arrow progress: 0 until start, then speed per frame until it
+    covers length, held until end. Chain several for arrows that regrow.
+    """
+    frames = -(-length // speed)  # whole frames, so the last value reaches length
+    if end is not None and start + frames > end:
+        frames = end - start
+    keyframes = [(start, 0), (start + frames, frames * speed)]
+    if end is not None:
+        keyframes.append((end, frames * speed))
+    return keyframes
+
+
+class Track:
+    """
+    A value keyframed over time, measured in design frames (1/60 s steps).
+
+    Keyframes are (time, value) pairs. Two keyframes at the same time make the
+    value jump there. Before the first keyframe the value is the first value,
+    after the last one it holds the last value. Evaluation is a binary search,
+    so any time can be looked up without replaying the ones before it.
+    """
+
+    def __init__(self, keyframes, interpolation="linear"):
+        # sorted() is stable, so keyframes sharing a time keep their order
+        keyframes = sorted(keyframes, key=lambda keyframe: keyframe[0])
+        self.times = [t for t, _ in keyframes]
+        self.values = [value for _, value in keyframes]
+        self.interpolation = interpolation
+
+    @classmethod
+    def step(cls, *keyframes):
+        """Track that holds each value until the next keyframe."""
+        return cls(keyframes, "step")
+
+    @classmethod
+    def linear(cls, *keyframes):
+        """Track that interpolates linearly between keyframes."""
+        return cls(keyframes, "linear")
+
+    @classmethod
+    def after(cls, t):
+        """Track that is False before frame t and True from it on."""
+        return cls.step((0, False), (t, True))
+
+    def value_at(self, t):
+        i = bisect_right(self.times, t) - 1
+        if i < 0:
+            return self.values[0]
+        if self.interpolation == "step" or i == len(self.times) - 1:
+            return self.values[i]
+
+        t0, t1 = self.times[i], self.times[i + 1]
+        return lerp(self.values[i], self.values[i + 1], (t - t0) / (t1 - t0))
+
+    def next_change(self, t):
+        """Return the first time after t at which the value may differ (t if it is changing now)."""
+        i = bisect_right(self.times, t)
+        if i == len(self.times):
+            return None
+        if self.interpolation == "linear" and i > 0 and self.values[i - 1] != self.values[i]:
+            return t
+        return self.times[i]
+
+
+class Timeline:
+    """Named tracks sharing one clock, with named markers and an optional loop."""
+
+    def __init__(self, duration, tracks, markers=None, loop=True):
+        self.duration = duration
+        self.tracks = tracks
+        self.markers = markers or {}
+        self.loop = loop
+
+    def wrap(self, t):
+        """Map a time onto the timeline: modulo the duration, or clamped if it does not loop."""
+        if self.loop:
+            return t % self.duration
+        return min(max(t, 0), self.duration)
+
+    def evaluate(self, t):
+        """Return the value of every track at time t."""
+        return {name: track.value_at(t) for name, track in self.tracks.items()}
+
+    def marker(self, name):
+        return self.markers[name]
+
+    def next_change(self, t):
+        """Return the first time after t at which any track may change (the loop end counts)."""
+        end = self.duration if self.loop else None
+        changes = [track.next_change(t) for track in self.tracks.values()]
+        changes = [change for change in changes + [end] if change is not None]
+        return min(changes, default=None)
@@ -1,11 +1,13 @@
 class PatternView:
-    def __init__(self, diagram_view, code_view, message_label, type_combo, pattern_combo, run_button):
+    def __init__(self, diagram_view, code_view, message_label, type_combo, pattern_combo, run_button,
+                 speed_combo):
         self.diagram_view = diagram_view
         self.code_view = code_view
         self.message_label = message_label
         self.type_combo = type_combo
         self.pattern_combo = pattern_combo
         self.run_button = run_button
+        self.speed_combo = speed_combo
 
     def update_pattern_dropdown(self, patterns):
         self.pattern_combo.clear()
@@ -15,6 +17,9 @@ class PatternView:
     def draw_pattern(self, pattern_data):
         self.diagram_view.draw_pattern_from_data(pattern_data)
 
+    def set_playback_rate(self, rate):
+        self.diagram_view.set_playback_rate(rate)
+
     def show_code(self, code):
         self.code_view.setPlainText(code)
 